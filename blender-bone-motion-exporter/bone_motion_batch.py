@@ -0,0 +1,270 @@
+# ❦ ˚`✵ electro-cute-angels ✵´˚ ❦
+"""
+Headless batch export of FBX takes with the Bone Motion Data Exporter
+
+Run it through Blender in background mode, everything after "--" belongs to this script:
+
+    blender -b --python bone_motion_batch.py -- takes/ -o exported/ --format CSV --jobs 8
+    blender -b --python bone_motion_batch.py -- "takes/**/*.fbx" -o exported/ --format JSON --coordinate-system WORLD
+
+Every FBX file is handled by its own worker Blender process (factory settings, one thread each),
+up to --jobs at a time. A worker imports the file, picks its animated armature and runs the same
+export operator as File > Export > Bone Motion Data with the options given as flags.
+"""
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import bone_motion_exporter
+
+def enum_choices(items):
+    return [item[0] for item in items]
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="blender -b --python bone_motion_batch.py --",
+        description="Export bone motion data from a directory or glob of FBX takes",
+    )
+    parser.add_argument("inputs", nargs="*", help="FBX files, directories or glob patterns")
+    parser.add_argument("-o", "--output-dir", help="Directory for the exported files")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Number of worker Blender processes (default: all cores)")
+    parser.add_argument("--recursive", action="store_true", help="Search input directories recursively")
+    parser.add_argument("--blender", default=bpy.app.binary_path, help="Blender executable for the workers")
+
+    export = parser.add_argument_group("export options")
+    export.add_argument("--format", default='CSV', choices=enum_choices(bone_motion_exporter.EXPORT_FORMAT_ITEMS))
+    export.add_argument("--coordinate-system", default='NORMALIZED', choices=enum_choices(bone_motion_exporter.COORDINATE_SYSTEM_ITEMS))
+    export.add_argument("--evaluation", default='SCENE', choices=enum_choices(bone_motion_exporter.EVALUATION_MODE_ITEMS))
+    export.add_argument("--isolate", action="store_true", help="Exclude scene content the armature doesn't depend on while sampling")
+    export.add_argument("--sample-cache", action="store_true", help="Reuse the raw samples of earlier exports of unchanged takes")
+    export.add_argument("--compression", default='NONE', choices=enum_choices(bone_motion_exporter.COMPRESSION_ITEMS))
+    export.add_argument("--compression-level", type=int, default=6)
+    export.add_argument("--bone", default="ALL", help="Bone to export (default: all bones)")
+    subset = export.add_mutually_exclusive_group()
+    subset.add_argument("--bone-pattern", metavar="PATTERN", help="Export the bones matching comma separated glob patterns, e.g. \"*Hand*,*Thumb*\"")
+    subset.add_argument("--bone-collection", metavar="NAME", help="Export the bones in a bone collection (bone group before Blender 4.0)")
+    subset.add_argument("--subtree", action="store_true", help="Export --bone and all its descendants")
+    export.add_argument("--regex", action="store_true", help="Treat --bone-pattern as a regular expression")
+    export.add_argument("--show-hidden-bones", action="store_true", help="Include bones hidden in the viewport")
+    export.add_argument("--all-frames", action="store_true", help="Export every frame instead of capping output at about 500 rows")
+    export.add_argument("--frame-step", type=int, default=1)
+    export.add_argument("--adaptive", type=float, metavar="TOLERANCE", help="Adaptive sampling: drop frames reproduced within TOLERANCE")
+    export.add_argument("--drop-keyframes", action="store_true", help="Let adaptive sampling drop keyed frames too (baked motion)")
+    export.add_argument("--precision", type=int, default=6)
+    export.add_argument("--start-frame", type=int, help="Custom first frame (needs --end-frame)")
+    export.add_argument("--end-frame", type=int, help="Custom last frame (needs --start-frame)")
+    export.add_argument("--no-bone-index", action="store_true", help="Leave out the by_bone_type index in JSON output")
+    export.add_argument("--profile", action="store_true", help="Write a <take>.profile.json with phase timings next to every export")
+
+    parser.add_argument("--worker", nargs=2, metavar=("FBX", "OUTPUT"), help=argparse.SUPPRESS)
+
+    args = parser.parse_args(argv)
+    if not args.worker and not (args.inputs and args.output_dir):
+        parser.error("the inputs and --output-dir are required")
+    if (args.start_frame is None) != (args.end_frame is None):
+        parser.error("--start-frame and --end-frame must be given together")
+    return args
+
+def get_glob_root(pattern):
+    """The leading directories of a glob pattern, up to the first one with a wildcard"""
+    parts = []
+    for part in os.path.normpath(pattern).split(os.sep)[:-1]:
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    root = os.sep.join(parts)
+    return root or (os.sep if parts else os.curdir)
+
+def collect_takes(inputs, output_dir, recursive):
+    """Map every FBX file found in inputs to its output path (without extension)"""
+    takes = {}
+    used_outputs = set()
+
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            root = pattern
+            search = os.path.join(pattern, "**", "*") if recursive else os.path.join(pattern, "*")
+            paths = glob.glob(search, recursive=recursive)
+        else:
+            root = get_glob_root(pattern)
+            paths = glob.glob(pattern, recursive=True)
+
+        for path in sorted(paths):
+            fbx_path = os.path.abspath(path)
+            if not path.lower().endswith(".fbx") or not os.path.isfile(path) or fbx_path in takes:
+                continue
+
+            # Inputs keep their sub-folder layout below the directory or the glob's fixed part,
+            # so equal take names in different folders don't collide
+            name = os.path.splitext(os.path.relpath(path, root))[0]
+            output_path = os.path.join(output_dir, name)
+
+            # Overlapping inputs can still map two takes to one output, number the later ones
+            number = 1
+            while os.path.normcase(output_path) in used_outputs:
+                number += 1
+                output_path = os.path.join(output_dir, f"{name}_{number}")
+            if number > 1:
+                print(f"{fbx_path} would overwrite another take, exporting it to {output_path}")
+
+            used_outputs.add(os.path.normcase(output_path))
+            takes[fbx_path] = output_path
+
+    return takes
+
+def worker_command(args, fbx_path, output_path):
+    forwarded = [
+        "--format", args.format,
+        "--coordinate-system", args.coordinate_system,
+        "--evaluation", args.evaluation,
+        "--compression", args.compression,
+        "--compression-level", str(args.compression_level),
+        "--bone", args.bone,
+        "--frame-step", str(args.frame_step),
+        "--precision", str(args.precision),
+    ]
+    if args.show_hidden_bones:
+        forwarded.append("--show-hidden-bones")
+    if args.bone_pattern is not None:
+        forwarded += ["--bone-pattern", args.bone_pattern]
+    if args.bone_collection is not None:
+        forwarded += ["--bone-collection", args.bone_collection]
+    if args.subtree:
+        forwarded.append("--subtree")
+    if args.regex:
+        forwarded.append("--regex")
+    if args.all_frames:
+        forwarded.append("--all-frames")
+    if args.isolate:
+        forwarded.append("--isolate")
+    if args.sample_cache:
+        forwarded.append("--sample-cache")
+    if args.no_bone_index:
+        forwarded.append("--no-bone-index")
+    if args.adaptive is not None:
+        forwarded += ["--adaptive", str(args.adaptive)]
+    if args.drop_keyframes:
+        forwarded.append("--drop-keyframes")
+    if args.profile:
+        forwarded.append("--profile")
+    if args.start_frame is not None:
+        forwarded += ["--start-frame", str(args.start_frame), "--end-frame", str(args.end_frame)]
+
+    return [
+        args.blender, "-b", "--factory-startup", "--threads", "1",
+        "--python-exit-code", "1",
+        "--python", os.path.abspath(__file__),
+        "--", "--worker", fbx_path, output_path,
+    ] + forwarded
+
+def pick_armature(objects):
+    """The armature with an action, preferring the one with the most bones"""
+    armatures = [obj for obj in objects if obj.type == 'ARMATURE']
+    animated = [obj for obj in armatures if obj.animation_data and obj.animation_data.action]
+    candidates = animated or armatures
+    if not candidates:
+        return None
+    return max(candidates, key=lambda obj: len(obj.data.bones))
+
+def run_worker(args):
+    fbx_path, output_path = args.worker
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    bone_motion_exporter.register()
+
+    bpy.ops.import_scene.fbx(filepath=fbx_path)
+    obj = pick_armature(bpy.context.scene.objects)
+    if obj is None:
+        print(f"No armature found in {fbx_path}")
+        return 1
+
+    view_layer = bpy.context.view_layer
+    for other in view_layer.objects:
+        other.select_set(False)
+    obj.select_set(True)
+    view_layer.objects.active = obj
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+    options = dict(
+        filepath=output_path,
+        export_format=args.format,
+        coordinate_system=args.coordinate_system,
+        evaluation_mode=args.evaluation,
+        isolate_evaluation=args.isolate,
+        use_sample_cache=args.sample_cache,
+        compression=args.compression,
+        compression_level=args.compression_level,
+        show_hidden_bones=args.show_hidden_bones,
+        bone_to_export=args.bone,
+        sample_all_frames=args.all_frames,
+        frame_step=args.frame_step,
+        precision=args.precision,
+        include_bone_index=not args.no_bone_index,
+        use_profiling=args.profile,
+        write_profile=args.profile,
+    )
+    if args.start_frame is not None:
+        options.update(use_custom_range=True, start_frame=args.start_frame, end_frame=args.end_frame)
+    if args.bone_pattern is not None:
+        options.update(bone_selection='PATTERN', bone_pattern=args.bone_pattern, use_regex=args.regex)
+    elif args.bone_collection is not None:
+        options.update(bone_selection='COLLECTION', bone_collection=args.bone_collection)
+    elif args.subtree:
+        options.update(bone_selection='SUBTREE')
+    if args.adaptive is not None:
+        options.update(sampling_mode='ADAPTIVE', adaptive_tolerance=args.adaptive, keep_keyframes=not args.drop_keyframes)
+
+    result = bpy.ops.export.bone_motion_data(**options)
+    return 0 if result == {'FINISHED'} else 1
+
+def run_batch(args):
+    takes = collect_takes(args.inputs, args.output_dir, args.recursive)
+    if not takes:
+        print("No FBX files found")
+        return 1
+
+    jobs = max(1, min(args.jobs, len(takes)))
+    print(f"Exporting {len(takes)} takes with {jobs} worker processes")
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(subprocess.run, worker_command(args, fbx_path, output_path), capture_output=True, text=True): fbx_path
+            for fbx_path, output_path in takes.items()
+        }
+
+        for done, future in enumerate(as_completed(futures), 1):
+            fbx_path = futures[future]
+            process = future.result()
+
+            if process.returncode == 0:
+                print(f"[{done}/{len(takes)}] {fbx_path}")
+            else:
+                failed.append(fbx_path)
+                print(f"[{done}/{len(takes)}] FAILED {fbx_path}")
+                print(process.stdout[-2000:])
+                print(process.stderr[-2000:])
+
+    print(f"Exported {len(takes) - len(failed)} of {len(takes)} takes")
+    for fbx_path in failed:
+        print(f"  failed: {fbx_path}")
+    return 1 if failed else 0
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    args = parse_args(argv)
+
+    if args.worker:
+        sys.exit(run_worker(args))
+    sys.exit(run_batch(args))
+
+if __name__ == "__main__":
+    main()
@@ -12,34 +12,1621 @@ bl_info = {
 }
 
 import bpy
+import bz2
 import csv
+import fnmatch
+import gzip
+import hashlib
+import io
 import json
+import lzma
 import os
+import re
+import socket
+import sqlite3
+import struct
+import subprocess
+import tempfile
+import time
+import zipfile
+from contextlib import ExitStack, closing, contextmanager
+from functools import partial
+import numpy as np
 from bpy_extras.io_utils import ExportHelper
 from bpy.props import StringProperty, EnumProperty, BoolProperty, IntProperty, FloatProperty
 from bpy.types import Operator, Panel
 
+EXPORT_FORMAT_ITEMS = (
+    ('CSV', "CSV", "Comma-separated values format"),
+    ('JSON', "JSON", "JavaScript Object Notation format"),
+    ('NDJSON', "JSON Lines", "One JSON object per frame, for progressive parsing"),
+    ('NPY', "NumPy", "Memory-mappable float32 .npy array with a .npz sidecar for frames, bone names and ranges"),
+    ('INDEXED', "Indexed Binary", "Chunked columnar float32 container with a seek index, read with bone_motion_reader.py"),
+    ('SQLITE', "SQLite", "Append the take to a SQLite motion library with indexed bones, frames and samples tables"),
+    ('QUANTIZED', "Quantized", "16-bit fixed-point values with per-frame delta encoding, for slow links"),
+)
+
+FORMAT_EXTENSIONS = {
+    'CSV': ".csv",
+    'JSON': ".json",
+    'NDJSON': ".jsonl",
+    'NPY': ".npy",
+    'INDEXED': ".bmotion",
+    'SQLITE': ".sqlite",
+    'QUANTIZED': ".bmq",
+}
+
+COMPRESSION_ITEMS = (
+    ('NONE', "None", "Write plain text"),
+    ('GZIP', "gzip", "gzip (.gz), fast and widely supported"),
+    ('XZ', "xz", "xz / LZMA (.xz), smallest files, slowest"),
+    ('BZ2', "bzip2", "bzip2 (.bz2)"),
+)
+
+COORDINATE_SYSTEM_ITEMS = (
+    ('NORMALIZED', "Normalize to [-1, 1]", "Normalize values to range [-1, 1] for Pd-L2Ork"),
+    ('WORLD', "World Coordinates", "Export raw world space coordinates"),
+)
+
+EVALUATION_MODE_ITEMS = (
+    ('SCENE', "Scene", "Evaluate the whole scene at every frame (supports constraints and drivers)"),
+    ('FCURVE', "Direct F-Curves", "Compose plain FK motion straight from the action's F-curves, falls back to scene evaluation for constraints or drivers"),
+)
+
+# Bone selector items by (armature data name, show hidden bones) as (bone count, items).
+# Blender doesn't copy the strings of dynamic enum items, the cache also keeps them alive.
+BONE_ENUM_CACHE = {}
+
+NO_BONE_ITEMS = [
+    ("ALL", "All Bones", "Export motion from all bones (will create a wider data structure)"),
+    ("NONE", "No Bones Found", "No bones found in the active armature"),
+]
+
+def strip_export_extension(filepath):
+    """filepath without its export format and compression extensions, e.g. take.csv.gz -> take"""
+    for extensions in (COMPRESSION_EXTENSIONS.values(), FORMAT_EXTENSIONS.values()):
+        for extension in extensions:
+            if filepath.lower().endswith(extension):
+                filepath = filepath[:-len(extension)]
+                break
+    return filepath
+
+def update_export_filepath(self, context):
+    """Swap the extension of the chosen file when the format or compression changes"""
+    self.update_extension(context)
+    if os.path.basename(self.filepath) and not self.filepath.endswith(self.filename_ext):
+        self.filepath = strip_export_extension(self.filepath) + self.filename_ext
+
 def get_bones_callback(self, context):
+    obj = context.active_object
+    if not obj or obj.type != 'ARMATURE' or not obj.pose:
+        return NO_BONE_ITEMS
+    
+    # Called on every redraw of the dialog, the items are only rebuilt after the armature changed
+    key = (obj.data.name, self.show_hidden_bones)
+    bone_count, items = BONE_ENUM_CACHE.get(key, (None, None))
+    if bone_count == len(obj.pose.bones):
+        return items
+    
     items = []
+    for i, bone in enumerate(obj.pose.bones):
+        if not self.show_hidden_bones and bone.bone.hide:
+            continue
+            
+        items.append((
+            bone.name,
+            bone.name,
+            f"Export motion from bone: {bone.name}"
+        ))
+    
+    items.insert(0, NO_BONE_ITEMS[0])
     
+    if len(items) == 1:
+        items.append(NO_BONE_ITEMS[1])
+    
+    BONE_ENUM_CACHE[key] = (len(obj.pose.bones), items)
+    return items
+
+# Bone collection selector items by collection names, kept alive like BONE_ENUM_CACHE
+BONE_COLLECTION_ITEMS = {}
+
+def get_bone_collections_callback(self, context):
     obj = context.active_object
+    names = ()
     if obj and obj.type == 'ARMATURE' and obj.pose:
-        for i, bone in enumerate(obj.pose.bones):
-            if not self.show_hidden_bones and bone.bone.hide:
-                continue
-                
-            items.append((
-                bone.name,
-                bone.name,
-                f"Export motion from bone: {bone.name}"
+        names = tuple(collection.name for collection in get_bone_collections(obj))
+    
+    if names not in BONE_COLLECTION_ITEMS:
+        items = [(name, name, f"Export motion from the bones in: {name}") for name in names]
+        if not items:
+            items.append(("NONE", "No Bone Collections Found", "The active armature has no bone collections or bone groups"))
+        BONE_COLLECTION_ITEMS[names] = items
+    return BONE_COLLECTION_ITEMS[names]
+
+@bpy.app.handlers.persistent
+def bone_enum_depsgraph_update(scene, depsgraph):
+    # Adding, removing, renaming or hiding bones updates the armature data, posing doesn't
+    if BONE_ENUM_CACHE and depsgraph.id_type_updated('ARMATURE'):
+        BONE_ENUM_CACHE.clear()
+
+CHANNEL_NAMES = ("pos_x", "pos_y", "pos_z", "rot_x", "rot_y", "rot_z")
+
+class MotionSampleStore:
+    """Contiguous float32 (frames, bones, channels) buffer of sampled motion plus its frame and bone tables"""
+    
+    def __init__(self, frames, bone_names):
+        self.frames = np.asarray(frames, dtype=np.int32)
+        self.bone_names = list(bone_names)
+        self.channels = np.zeros((len(self.frames), len(self.bone_names), len(CHANNEL_NAMES)), dtype=np.float32)
+        self.min_values = None
+        self.max_values = None
+    
+    @property
+    def frame_count(self):
+        return len(self.frames)
+    
+    @property
+    def bone_count(self):
+        return len(self.bone_names)
+    
+    def truncate(self, frame_count):
+        """Drop every frame from frame_count on, e.g. when a capture is cancelled part way"""
+        self.frames = self.frames[:frame_count]
+        self.channels = self.channels[:frame_count]
+    
+    def keep_rows(self, rows):
+        """Keep only the given frame rows (index array or boolean mask), e.g. after adaptive decimation"""
+        self.frames = self.frames[rows]
+        self.channels = self.channels[rows]
+    
+    def normalize(self):
+        """Map every channel into [-1, 1] in place, keeping the ranges for reconstruction"""
+        self.min_values, self.max_values = get_normalization_ranges(self.channels)
+        scale = 2.0 / (self.max_values - self.min_values)
+        
+        self.channels -= self.min_values
+        self.channels *= scale
+        self.channels -= 1.0
+        np.clip(self.channels, -1.0, 1.0, out=self.channels)
+
+def column_names_for(bone_names):
+    """CSV column names after the frame column"""
+    if len(bone_names) == 1:
+        return list(CHANNEL_NAMES)
+    return [f"{bone_name}_{channel}" for bone_name in bone_names for channel in CHANNEL_NAMES]
+
+class MotionCSVWriter:
+    """
+    Writes the header once, then each frame as a plain fixed-precision row. Combined
+    multi-action files get a leading action column, set per action with begin_action.
+    """
+    
+    def __init__(self, csvfile, bone_names, precision, action_column=False):
+        self.csvfile = csvfile
+        self.row_prefix = ""
+        column_names = column_names_for(bone_names)
+        self.row_format = ",".join(["%d"] + [f"%.{precision}f"] * len(column_names)) + "\r\n"
+        csv.writer(csvfile).writerow((["action"] if action_column else []) + ["frame"] + column_names)
+    
+    def begin_action(self, action_name, frames, ranges):
+        field = io.StringIO()
+        csv.writer(field, lineterminator=",").writerow([action_name])
+        self.row_prefix = field.getvalue()
+    
+    def write_frame(self, frame, frame_channels):
+        self.csvfile.write(self.row_prefix + self.row_format % (frame, *frame_channels.ravel().tolist()))
+    
+    def finish(self):
+        pass
+
+def bones_json_template(bone_names, precision):
+    """%-template for one frame's bones as a JSON object body, filled with the flattened channel values"""
+    value = f"%.{precision}f"
+    bone_body = (
+        f'{{"position": {{"x": {value}, "y": {value}, "z": {value}}}, '
+        f'"rotation": {{"x": {value}, "y": {value}, "z": {value}}}}}'
+    )
+    return ", ".join(json.dumps(bone_name).replace("%", "%%") + ": " + bone_body for bone_name in bone_names)
+
+class MotionJSONWriter:
+    """
+    Streams the by_frame object one frame per line, metadata and bone index are written up front.
+    Combined multi-action files hold an "actions" object with one by_frame per action instead.
+    """
+    
+    def __init__(self, jsonfile, bone_names, precision, header, combined=False):
+        self.jsonfile = jsonfile
+        self.combined = combined
+        self.in_action = False
+        self.frame_format = '"%d": {' + bones_json_template(bone_names, precision) + '}'
+        self.separator = "\n"
+        jsonfile.write(json.dumps(header)[:-1] + (', "actions": {' if combined else ', "by_frame": {'))
+    
+    def begin_action(self, action_name, frames, ranges):
+        action_header = {"frame_count": len(frames), "frame_range": [int(frames[0]), int(frames[-1])]}
+        self.jsonfile.write(
+            ("\n}}," if self.in_action else "") + "\n"
+            + json.dumps(action_name) + ": " + json.dumps(action_header)[:-1] + ', "by_frame": {'
+        )
+        self.in_action = True
+        self.separator = "\n"
+    
+    def write_frame(self, frame, frame_channels):
+        self.jsonfile.write(self.separator + self.frame_format % (frame, *frame_channels.ravel().tolist()))
+        self.separator = ",\n"
+    
+    def finish(self):
+        if self.in_action:
+            self.jsonfile.write("\n}}")
+        self.jsonfile.write("\n}}\n")
+
+class MotionNDJSONWriter:
+    """JSON Lines: a header object followed by one self-contained object per frame"""
+    
+    def __init__(self, jsonfile, bone_names, precision, header):
+        self.jsonfile = jsonfile
+        self.frame_prefix = "{"
+        self.frame_format = '"frame": %d, "bones": {' + bones_json_template(bone_names, precision) + '}}\n'
+        jsonfile.write(json.dumps(header) + "\n")
+    
+    def begin_action(self, action_name, frames, ranges):
+        self.frame_prefix = '{"action": ' + json.dumps(action_name) + ", "
+    
+    def write_frame(self, frame, frame_channels):
+        self.jsonfile.write(self.frame_prefix + self.frame_format % (frame, *frame_channels.ravel().tolist()))
+    
+    def finish(self):
+        pass
+
+class MotionSplitWriter:
+    """Hands every writer its own slice of each frame's bones, one writer per armature"""
+    
+    def __init__(self, writers, bone_slices):
+        self.writers = writers
+        self.bone_slices = bone_slices
+    
+    @property
+    def max_error(self):
+        return max(writer.max_error for writer in self.writers)
+    
+    def write_frame(self, frame, frame_channels):
+        for writer, bone_slice in zip(self.writers, self.bone_slices):
+            writer.write_frame(frame, frame_channels[bone_slice])
+    
+    def finish(self):
+        for writer in self.writers:
+            writer.finish()
+
+class MotionNPYWriter:
+    """
+    Writes the (frames, bones, 6) float32 array as a plain .npy frame by frame, so it can be
+    opened with np.load(mmap_mode='r'). Frames, bone names and normalization ranges go to a
+    .npz sidecar with the same name.
+    """
+    
+    def __init__(self, npyfile, frames, bone_names, coordinate_system, ranges=None):
+        self.npyfile = npyfile
+        self.sidecar = {
+            "frames": np.asarray(frames, dtype=np.int32),
+            "bone_names": np.array(bone_names, dtype=str),
+            "channel_names": np.array(CHANNEL_NAMES),
+            "coordinate_system": np.array(coordinate_system.lower()),
+        }
+        if ranges is not None:
+            self.sidecar["min_values"], self.sidecar["max_values"] = ranges
+        
+        self.header = {
+            "descr": "<f4",
+            "fortran_order": False,
+            "shape": (len(frames), len(bone_names), len(CHANNEL_NAMES)),
+        }
+        np.lib.format.write_array_header_1_0(npyfile, self.header)
+        self.data_offset = npyfile.tell()
+        self.frame_count = 0
+    
+    def write_frame(self, frame, frame_channels):
+        self.npyfile.write(frame_channels.astype("<f4", copy=False).tobytes())
+        self.frame_count += 1
+    
+    def finish(self):
+        if self.frame_count < len(self.sidecar["frames"]):
+            self.shrink_header()
+        np.savez(os.path.splitext(self.npyfile.name)[0] + ".npz", **self.sidecar)
+    
+    def shrink_header(self):
+        """Rewrite the header in place for an export that stopped early, padded to its original size"""
+        self.sidecar["frames"] = self.sidecar["frames"][:self.frame_count]
+        self.header["shape"] = (self.frame_count, *self.header["shape"][1:])
+        
+        buffer = io.BytesIO()
+        np.lib.format.write_array_header_1_0(buffer, self.header)
+        header = buffer.getvalue()
+        
+        # Magic (6 bytes), version (2), header length (2), then the dict padded with spaces up to "\n"
+        padding = self.data_offset - len(header)
+        header = header[:8] + struct.pack("<H", len(header) - 10 + padding) + header[10:-1] + b" " * padding + b"\n"
+        
+        self.npyfile.seek(0)
+        self.npyfile.write(header)
+        self.npyfile.seek(0, os.SEEK_END)
+
+# Indexed binary layout, keep in sync with bone_motion_reader.py
+INDEXED_MAGIC = b"BMOTION1"
+INDEXED_END_MAGIC = b"BMINDEX1"
+INDEXED_VERSION = 1
+INDEXED_FLAG_NORMALIZED = 1
+INDEXED_HEADER = struct.Struct("<8sHHIII")
+INDEXED_TRAILER = struct.Struct("<QQ8s")
+
+class MotionIndexedWriter:
+    """
+    Chunked columnar container: every chunk of frames stores one contiguous (frames, 6)
+    float32 block per bone, and a footer indexes the frames and every chunk/bone block so
+    bone_motion_reader.py can seek to a bone or frame window without reading the rest.
+    """
+    
+    CHUNK_FRAMES = 256
+    
+    def __init__(self, outfile, bone_names, coordinate_system, ranges=None):
+        self.outfile = outfile
+        self.bone_names = list(bone_names)
+        self.ranges = ranges
+        self.chunk = np.empty((self.CHUNK_FRAMES, len(self.bone_names), len(CHANNEL_NAMES)), dtype="<f4")
+        self.chunk_length = 0
+        self.frames = []
+        self.chunk_offsets = []
+        self.bone_offsets = []
+        
+        flags = INDEXED_FLAG_NORMALIZED if coordinate_system == 'NORMALIZED' else 0
+        header = INDEXED_HEADER.pack(
+            INDEXED_MAGIC, INDEXED_VERSION, flags,
+            len(self.bone_names), len(CHANNEL_NAMES), self.CHUNK_FRAMES
+        )
+        outfile.write(header)
+        self.position = len(header)
+    
+    def write_frame(self, frame, frame_channels):
+        self.chunk[self.chunk_length] = frame_channels
+        self.chunk_length += 1
+        self.frames.append(frame)
+        
+        if self.chunk_length == self.CHUNK_FRAMES:
+            self.flush_chunk()
+    
+    def flush_chunk(self):
+        block_size = self.chunk_length * len(CHANNEL_NAMES) * 4
+        self.chunk_offsets.append(self.position)
+        self.bone_offsets.extend(self.position + bone_idx * block_size for bone_idx in range(len(self.bone_names)))
+        
+        data = np.ascontiguousarray(self.chunk[:self.chunk_length].transpose(1, 0, 2)).tobytes()
+        self.outfile.write(data)
+        self.position += len(data)
+        self.chunk_length = 0
+    
+    def finish(self):
+        if self.chunk_length:
+            self.flush_chunk()
+        
+        footer = [
+            struct.pack("<II", len(self.frames), len(self.chunk_offsets)),
+            np.asarray(self.frames, dtype="<i4").tobytes(),
+            np.asarray(self.chunk_offsets, dtype="<u8").tobytes(),
+            np.asarray(self.bone_offsets, dtype="<u8").tobytes(),
+        ]
+        for bone_name in self.bone_names:
+            encoded = bone_name.encode("utf-8")
+            footer.append(struct.pack("<H", len(encoded)) + encoded)
+        
+        if self.ranges is not None:
+            footer.append(b"\x01")
+            footer.extend(np.asarray(values, dtype="<f4").tobytes() for values in self.ranges)
+        else:
+            footer.append(b"\x00")
+        
+        footer = b"".join(footer)
+        self.outfile.write(footer)
+        self.outfile.write(INDEXED_TRAILER.pack(self.position, len(footer), INDEXED_END_MAGIC))
+
+def get_patch_data_offset(motion_file, export_format, frame_count, bone_count):
+    """Offset of the first sample of an existing world-space .npy / .bmotion file of the given shape, None if it doesn't match"""
+    if export_format == 'NPY':
+        if np.lib.format.read_magic(motion_file) != (1, 0):
+            return None
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(motion_file)
+        if shape != (frame_count, bone_count, len(CHANNEL_NAMES)) or fortran_order or dtype != np.dtype("<f4"):
+            return None
+        return motion_file.tell()
+    
+    header = motion_file.read(INDEXED_HEADER.size)
+    if len(header) != INDEXED_HEADER.size:
+        return None
+    magic, version, flags, file_bone_count, channel_count, chunk_frames = INDEXED_HEADER.unpack(header)
+    if (magic, version, flags, file_bone_count, channel_count, chunk_frames) != (
+        INDEXED_MAGIC, INDEXED_VERSION, 0, bone_count, len(CHANNEL_NAMES), MotionIndexedWriter.CHUNK_FRAMES
+    ):
+        return None
+    
+    motion_file.seek(-INDEXED_TRAILER.size, os.SEEK_END)
+    footer_offset, footer_size, end_magic = INDEXED_TRAILER.unpack(motion_file.read(INDEXED_TRAILER.size))
+    if end_magic != INDEXED_END_MAGIC or footer_offset != INDEXED_HEADER.size + frame_count * bone_count * len(CHANNEL_NAMES) * 4:
+        return None
+    return INDEXED_HEADER.size
+
+class MotionPatchWriter:
+    """
+    Overwrites only the changed rows of an existing world-space .npy or .bmotion file in place,
+    every other frame is skipped. Used by watched exports (see MotionWatch).
+    """
+    
+    def __init__(self, outfile, export_format, frame_count, bone_count, data_offset, changed_rows):
+        self.outfile = outfile
+        self.indexed = export_format == 'INDEXED'
+        self.frame_count = frame_count
+        self.bone_count = bone_count
+        self.data_offset = data_offset
+        self.changed_rows = set(changed_rows.tolist())
+        self.row = 0
+        self.bytes_written = 0
+    
+    def write_frame(self, frame, frame_channels):
+        row = self.row
+        self.row += 1
+        if row not in self.changed_rows:
+            return
+        
+        values = frame_channels.astype("<f4", copy=False)
+        row_size = len(CHANNEL_NAMES) * 4
+        self.bytes_written += values.nbytes
+        if not self.indexed:
+            self.outfile.seek(self.data_offset + row * self.bone_count * row_size)
+            self.outfile.write(values.tobytes())
+            return
+        
+        # Every chunk before this one is full, the last chunk may be shorter
+        chunk_frames = MotionIndexedWriter.CHUNK_FRAMES
+        chunk_idx, chunk_row = divmod(row, chunk_frames)
+        chunk_length = min(chunk_frames, self.frame_count - chunk_idx * chunk_frames)
+        chunk_offset = self.data_offset + chunk_idx * chunk_frames * self.bone_count * row_size
+        for bone_idx in range(self.bone_count):
+            self.outfile.seek(chunk_offset + (bone_idx * chunk_length + chunk_row) * row_size)
+            self.outfile.write(values[bone_idx].tobytes())
+    
+    def finish(self):
+        self.outfile.flush()
+
+# Largest OSC datagram, bundles of big rigs are split into several
+OSC_MAX_DATAGRAM = 8192
+
+def osc_string(text):
+    """OSC string: UTF-8, null terminated and padded to a multiple of 4 bytes"""
+    data = text.encode("utf-8") + b"\0"
+    return data + b"\0" * (-len(data) % 4)
+
+class MotionOSCWriter:
+    """
+    Sends every frame over UDP as OSC: a <prefix>/frame message with the frame number and one
+    <prefix>/<bone> message with the six channels per bone, as bundles or single messages.
+    Bundles too big for one datagram are split, each part repeating the frame message.
+    The datagrams are laid out once, a frame only overwrites their arguments in place.
+    """
+    
+    def __init__(self, host, port, address_prefix, bone_names, use_bundles=True):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.address = (host, port)
+        
+        prefix = address_prefix.rstrip("/")
+        messages = [(osc_string(prefix + "/frame") + osc_string(",i"), 1)]
+        for bone_name in bone_names:
+            # OSC reserves space and # * , / ? [ ] { } in address parts
+            address = prefix + "/" + re.sub(r"[\s#*,/?\[\]{}]", "_", bone_name)
+            messages.append((osc_string(address) + osc_string("," + "f" * len(CHANNEL_NAMES)), len(CHANNEL_NAMES)))
+        
+        def add_message(message_idx):
+            header, arg_count = messages[message_idx]
+            datagram, arguments = layouts[-1]
+            if use_bundles:
+                datagram += struct.pack(">i", len(header) + 4 * arg_count)
+            arguments.append((message_idx, len(datagram) + len(header)))
+            datagram += header + bytes(4 * arg_count)
+        
+        # (datagram, [(message index, argument offset)])
+        layouts = []
+        for message_idx, (header, arg_count) in enumerate(messages):
+            size = len(header) + 4 * arg_count
+            element_size = size + 4 if use_bundles else size
+            if not layouts or not use_bundles or len(layouts[-1][0]) + element_size > OSC_MAX_DATAGRAM:
+                layouts.append((bytearray(b"#bundle\0" + struct.pack(">Q", 1)) if use_bundles else bytearray(), []))
+                if use_bundles and message_idx > 0:
+                    # Datagrams may be dropped or reordered, every part of a split bundle names its frame
+                    add_message(0)
+            
+            add_message(message_idx)
+        
+        self.datagrams = []
+        for datagram, arguments in layouts:
+            frame_index = None
+            float_indices = []
+            value_indices = []
+            for message_idx, offset in arguments:
+                if message_idx == 0:
+                    frame_index = offset // 4
+                else:
+                    bone_idx = message_idx - 1
+                    float_indices.extend(range(offset // 4, offset // 4 + len(CHANNEL_NAMES)))
+                    value_indices.extend(range(bone_idx * len(CHANNEL_NAMES), (bone_idx + 1) * len(CHANNEL_NAMES)))
+            
+            # Big-endian views sharing the datagram's memory
+            self.datagrams.append((
+                datagram, np.frombuffer(datagram, dtype=">f4"), np.frombuffer(datagram, dtype=">i4"),
+                frame_index, np.array(float_indices, dtype=np.intp), np.array(value_indices, dtype=np.intp)
             ))
     
-    items.insert(0, ("ALL", "All Bones", "Export motion from all bones (will create a wider data structure)"))
+    def write_frame(self, frame, frame_channels):
+        values = frame_channels.ravel()
+        for datagram, floats, ints, frame_index, float_indices, value_indices in self.datagrams:
+            floats[float_indices] = values[value_indices]
+            if frame_index is not None:
+                ints[frame_index] = frame
+            try:
+                self.socket.sendto(datagram, self.address)
+            except OSError:
+                # UDP is fire and forget, a receiver that isn't listening yet must not stop playback
+                pass
     
-    if len(items) == 1:
-        items.append(("NONE", "No Bones Found", "No bones found in the active armature"))
+    def finish(self):
+        self.socket.close()
+
+# Shared memory ring buffer layout, keep in sync with bone_motion_live.py
+LIVE_MAGIC = b"BMLIVE01"
+LIVE_VERSION = 1
+LIVE_FLAG_NORMALIZED = 1
+LIVE_FLAG_RANGES = 2
+LIVE_HEADER = struct.Struct("<8sHHIIIIII")
+LIVE_SEQUENCE_OFFSET = 40
+LIVE_NAMES_OFFSET = 48
+LIVE_SLOT_VALUES_OFFSET = 16
+
+class MotionSharedMemoryWriter:
+    """
+    Writes every frame into a fixed-layout ring buffer in a multiprocessing.shared_memory block:
+    a header with the CSV column names, bone names (and normalization ranges), a published sequence counter
+    and slot_count slots of (sequence, frame, bones x 6 float32). Read it with bone_motion_live.py.
+    """
     
-    return items
+    def __init__(self, block_name, bone_names, coordinate_system, slot_count, ranges=None):
+        # Python 3.8+ (Blender 2.83+)
+        from multiprocessing import shared_memory
+        
+        # CSV header line, then the bone names (a single bone's columns don't carry its name)
+        names = "\n".join([",".join(["frame"] + column_names_for(bone_names))] + list(bone_names)).encode("utf-8")
+        value_count = len(bone_names) * len(CHANNEL_NAMES)
+        ranges_offset = LIVE_NAMES_OFFSET + len(names) + (-len(names) % 8)
+        slots_offset = ranges_offset + (8 * value_count if ranges is not None else 0)
+        slots_offset += -slots_offset % 64
+        slot_size = LIVE_SLOT_VALUES_OFFSET + 4 * value_count
+        slot_size += -slot_size % 8
+        
+        size = slots_offset + slot_count * slot_size
+        try:
+            self.block = shared_memory.SharedMemory(name=block_name, create=True, size=size)
+        except FileExistsError:
+            # Left over from a session that didn't shut down cleanly
+            stale = shared_memory.SharedMemory(name=block_name)
+            stale.close()
+            stale.unlink()
+            self.block = shared_memory.SharedMemory(name=block_name, create=True, size=size)
+        
+        flags = LIVE_FLAG_NORMALIZED if coordinate_system == 'NORMALIZED' else 0
+        if ranges is not None:
+            flags |= LIVE_FLAG_RANGES
+        
+        buffer = self.block.buf
+        buffer[:LIVE_HEADER.size] = LIVE_HEADER.pack(
+            LIVE_MAGIC, LIVE_VERSION, flags, len(bone_names), len(CHANNEL_NAMES),
+            slot_count, slot_size, slots_offset, len(names)
+        )
+        buffer[LIVE_NAMES_OFFSET:LIVE_NAMES_OFFSET + len(names)] = names
+        if ranges is not None:
+            range_values = np.concatenate([np.asarray(values, dtype="<f4").ravel() for values in ranges])
+            buffer[ranges_offset:ranges_offset + range_values.nbytes] = range_values.tobytes()
+        
+        slot_dtype = np.dtype({
+            "names": ["sequence", "frame", "values"],
+            "formats": ["<u8", "<i4", ("<f4", (len(bone_names), len(CHANNEL_NAMES)))],
+            "offsets": [0, 8, LIVE_SLOT_VALUES_OFFSET],
+            "itemsize": slot_size,
+        })
+        self.published = np.ndarray((1,), dtype="<u8", buffer=buffer, offset=LIVE_SEQUENCE_OFFSET)
+        self.slots = np.ndarray((slot_count,), dtype=slot_dtype, buffer=buffer, offset=slots_offset)
+        self.published[0] = 0
+        self.slots["sequence"] = 0
+        self.sequence = 0
+    
+    def write_frame(self, frame, frame_channels):
+        self.sequence += 1
+        slot = self.slots[(self.sequence - 1) % len(self.slots)]
+        
+        # The slot reads 0 while it is rewritten, readers check it against the sequence they expect
+        slot["sequence"] = 0
+        slot["frame"] = frame
+        slot["values"] = frame_channels
+        slot["sequence"] = self.sequence
+        self.published[0] = self.sequence
+    
+    def finish(self):
+        # Views into the block must go before it can be closed
+        del self.published, self.slots
+        self.block.close()
+        self.block.unlink()
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS takes (
+    take_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    coordinate_system TEXT NOT NULL,
+    exported_at TEXT NOT NULL,
+    frame_count INTEGER NOT NULL DEFAULT 0,
+    bone_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bones (
+    bone_id INTEGER PRIMARY KEY,
+    take_id INTEGER NOT NULL REFERENCES takes (take_id),
+    name TEXT NOT NULL,
+    bone_type TEXT NOT NULL,
+    %(range_columns)s
+);
+CREATE TABLE IF NOT EXISTS frames (
+    take_id INTEGER NOT NULL REFERENCES takes (take_id),
+    frame INTEGER NOT NULL,
+    PRIMARY KEY (take_id, frame)
+);
+CREATE TABLE IF NOT EXISTS samples (
+    bone_id INTEGER NOT NULL REFERENCES bones (bone_id),
+    frame INTEGER NOT NULL,
+    %(sample_columns)s
+);
+CREATE INDEX IF NOT EXISTS bones_take_name ON bones (take_id, name);
+CREATE UNIQUE INDEX IF NOT EXISTS samples_bone_frame ON samples (bone_id, frame);
+""" % {
+    "range_columns": ",\n    ".join(f"{bound}_{channel} REAL" for bound in ("min", "max") for channel in CHANNEL_NAMES),
+    "sample_columns": ",\n    ".join(f"{channel} REAL NOT NULL" for channel in CHANNEL_NAMES),
+}
+
+class MotionSQLiteWriter:
+    """
+    Appends takes to a SQLite motion library (takes, bones, frames and samples tables),
+    inserting samples with batched executemany inside a single transaction. Every
+    begin_action starts a new take.
+    """
+    
+    BATCH_FRAMES = 256
+    
+    def __init__(self, connection, bone_names, precision, coordinate_system):
+        self.connection = connection
+        self.bone_names = list(bone_names)
+        self.precision = precision
+        self.coordinate_system = coordinate_system.lower()
+        self.take_id = None
+        self.bone_ids = []
+        self.frame_rows = []
+        self.sample_rows = []
+        self.frame_count = 0
+        
+        connection.executescript(SQLITE_SCHEMA)
+        connection.execute("BEGIN")
+        
+        range_columns = [f"{bound}_{channel}" for bound in ("min", "max") for channel in CHANNEL_NAMES]
+        self.range_column_count = len(range_columns)
+        self.insert_bone = (
+            f"INSERT INTO bones (take_id, name, bone_type, {', '.join(range_columns)}) "
+            f"VALUES (?, ?, ?, {', '.join('?' * len(range_columns))})"
+        )
+        self.insert_sample = (
+            f"INSERT INTO samples (bone_id, frame, {', '.join(CHANNEL_NAMES)}) "
+            f"VALUES (?, ?, {', '.join('?' * len(CHANNEL_NAMES))})"
+        )
+    
+    def begin_action(self, action_name, frames, ranges):
+        self.finish_take()
+        
+        cursor = self.connection.execute(
+            "INSERT INTO takes (name, coordinate_system, exported_at, bone_count) VALUES (?, ?, ?, ?)",
+            (action_name, self.coordinate_system, time.strftime("%Y-%m-%dT%H:%M:%S"), len(self.bone_names))
+        )
+        self.take_id = cursor.lastrowid
+        
+        self.bone_ids = []
+        for bone_idx, bone_name in enumerate(self.bone_names):
+            if ranges is not None:
+                bone_range = ranges[0][bone_idx].tolist() + ranges[1][bone_idx].tolist()
+            else:
+                bone_range = [None] * self.range_column_count
+            cursor = self.connection.execute(self.insert_bone, (self.take_id, bone_name, get_bone_type(bone_name), *bone_range))
+            self.bone_ids.append(cursor.lastrowid)
+    
+    def write_frame(self, frame, frame_channels):
+        values = np.round(frame_channels.astype(np.float64), self.precision).tolist()
+        self.frame_rows.append((self.take_id, frame))
+        self.sample_rows.extend((bone_id, frame, *bone_values) for bone_id, bone_values in zip(self.bone_ids, values))
+        
+        if len(self.frame_rows) >= self.BATCH_FRAMES:
+            self.flush()
+    
+    def flush(self):
+        self.connection.executemany("INSERT INTO frames (take_id, frame) VALUES (?, ?)", self.frame_rows)
+        self.connection.executemany(self.insert_sample, self.sample_rows)
+        self.frame_count += len(self.frame_rows)
+        self.frame_rows = []
+        self.sample_rows = []
+    
+    def finish_take(self):
+        if self.take_id is None:
+            return
+        
+        self.flush()
+        self.connection.execute("UPDATE takes SET frame_count = ? WHERE take_id = ?", (self.frame_count, self.take_id))
+        self.take_id = None
+        self.frame_count = 0
+    
+    def finish(self):
+        self.finish_take()
+        self.connection.commit()
+
+# Quantized layout, keep in sync with bone_motion_reader.py
+QUANTIZED_MAGIC = b"BMQUANT1"
+QUANTIZED_VERSION = 1
+QUANTIZED_FLAG_NORMALIZED = 1
+QUANTIZED_SCALE = 32767
+QUANTIZED_HEADER = struct.Struct("<8sHHIII")
+
+def zigzag(values):
+    """Map signed int32 values to unsigned so small magnitudes stay small"""
+    values = np.asarray(values, dtype=np.int64)
+    return (values << 1) ^ (values >> 63)
+
+def encode_varints(values):
+    """LEB128-encode non-negative integers below 2**21 in one vectorized pass"""
+    values = np.asarray(values, dtype=np.uint32)
+    groups = np.stack((values & 0x7F, (values >> 7) & 0x7F, (values >> 14) & 0x7F), axis=-1).astype(np.uint8)
+    lengths = 1 + (values >= 1 << 7) + (values >= 1 << 14)
+    
+    positions = np.arange(3)
+    groups[positions < (lengths - 1)[:, None]] |= 0x80
+    return groups[positions < lengths[:, None]].tobytes()
+
+def encode_varint(value):
+    """LEB128-encode a single non-negative integer of any size"""
+    encoded = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+class MotionQuantizedWriter:
+    """
+    16-bit fixed-point motion: values are quantized within their per-bone ranges to
+    [-32767, 32767] and every frame stores zigzag varint deltas against the previous one.
+    The ranges are kept in the header so values can be reconstructed.
+    """
+    
+    def __init__(self, outfile, bone_names, coordinate_system, ranges):
+        self.outfile = outfile
+        self.min_values = np.asarray(ranges[0], dtype=np.float64)
+        self.max_values = np.asarray(ranges[1], dtype=np.float64)
+        self.normalized_input = coordinate_system == 'NORMALIZED'
+        self.previous = np.zeros(self.min_values.shape, dtype=np.int64)
+        self.previous_frame = 0
+        self.max_error = 0.0
+        
+        flags = QUANTIZED_FLAG_NORMALIZED if self.normalized_input else 0
+        outfile.write(QUANTIZED_HEADER.pack(
+            QUANTIZED_MAGIC, QUANTIZED_VERSION, flags,
+            len(bone_names), len(CHANNEL_NAMES), QUANTIZED_SCALE
+        ))
+        for bone_name in bone_names:
+            encoded = bone_name.encode("utf-8")
+            outfile.write(struct.pack("<H", len(encoded)) + encoded)
+        outfile.write(self.min_values.astype("<f4").tobytes())
+        outfile.write(self.max_values.astype("<f4").tobytes())
+    
+    def write_frame(self, frame, frame_channels):
+        values = frame_channels.astype(np.float64)
+        span = self.max_values - self.min_values
+        
+        if self.normalized_input:
+            normalized = values
+        else:
+            normalized = 2.0 * (values - self.min_values) / span - 1.0
+        
+        quantized = np.rint(np.clip(normalized, -1.0, 1.0) * QUANTIZED_SCALE).astype(np.int64)
+        
+        decoded = quantized / QUANTIZED_SCALE
+        if not self.normalized_input:
+            decoded = self.min_values + (decoded + 1.0) * 0.5 * span
+        self.max_error = max(self.max_error, float(np.abs(decoded - values).max()))
+        
+        self.outfile.write(encode_varint(int(zigzag(frame - self.previous_frame))))
+        self.outfile.write(encode_varints(zigzag(quantized - self.previous).ravel()))
+        self.previous = quantized
+        self.previous_frame = frame
+    
+    def finish(self):
+        pass
+
+TEXT_FORMATS = {'CSV', 'JSON', 'NDJSON'}
+
+# Formats whose writers can hold several actions in one file (begin_action)
+COMBINED_FORMATS = {'CSV', 'JSON', 'NDJSON', 'SQLITE'}
+
+# Modal export: timer event interval and the time spent exporting per event
+MODAL_TIMER_INTERVAL = 0.01
+MODAL_SLICE_SECONDS = 0.05
+SHARD_POLL_SECONDS = 0.05
+
+# Watch mode: quiet time after the last keyframe edit before a watched export refreshes
+WATCH_DEBOUNCE_SECONDS = 0.3
+
+# Profiling: export phases in report order, and the bins of the per-frame time histograms
+PROFILE_PHASES = (
+    ("evaluate", "frame_set/update"),
+    ("math", "matrix math"),
+    ("process", "processing"),
+    ("write", "serialization"),
+)
+PROFILE_HISTOGRAM_BINS = 20
+
+# Sample cache: raw world-space samples by content hash, least recently used entries go first over the limit
+SAMPLE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "bone_motion_sample_cache")
+SAMPLE_CACHE_MAX_BYTES = 1024 ** 3
+SAMPLE_CACHE_VERSION = 2
+
+COMPRESSION_EXTENSIONS = {
+    'GZIP': ".gz",
+    'XZ': ".xz",
+    'BZ2': ".bz2",
+}
+
+def open_compressed_text(filepath, compression, level):
+    """Open a text file for writing through a streaming stdlib compressor"""
+    if compression == 'GZIP':
+        return gzip.open(filepath, 'wt', compresslevel=level, newline='')
+    elif compression == 'XZ':
+        return lzma.open(filepath, 'wt', preset=level, newline='')
+    elif compression == 'BZ2':
+        return bz2.open(filepath, 'wt', compresslevel=level, newline='')
+    return open(filepath, 'w', newline='')
+
+# Scene scrubs running right now (exports, watch refreshes, range captures), live streams ignore their frame changes
+SCENE_SCRUBS = 0
+
+def iter_scene_channels(context, rigs, frames, profile=None):
+    """
+    Evaluate the scene frame by frame and grab all pose matrices with a single foreach_get per armature
+    
+    Args:
+        context: Blender context
+        rigs: List of (armature object, pose bones to capture), all read from the same evaluation
+        frames: Frame numbers to evaluate
+        profile: Optional MotionProfile timing the evaluation and the matrix math of every frame
+    
+    Yields:
+        (frame_idx, frame, array of shape (bones, 6)) for every frame, bones of all rigs in order
+    """
+    captures = []
+    for obj, bones in rigs:
+        pose_bones = obj.pose.bones
+        bone_indices = [pose_bones.find(bone.name) for bone in bones]
+        captures.append((obj, bone_indices, np.empty(len(pose_bones) * 16, dtype=np.float32)))
+    
+    global SCENE_SCRUBS
+    SCENE_SCRUBS += 1
+    try:
+        for frame_idx, frame in enumerate(frames):
+            started = time.perf_counter()
+            context.scene.frame_set(frame)
+            context.view_layer.update()
+            evaluated = time.perf_counter()
+            
+            world_matrices = [read_world_matrices(obj, bone_indices, buffer) for obj, bone_indices, buffer in captures]
+            frame_channels = matrices_to_channels(np.concatenate(world_matrices))
+            if profile is not None:
+                profile.add_frame(evaluated - started, time.perf_counter() - evaluated)
+            yield frame_idx, frame, frame_channels
+    finally:
+        SCENE_SCRUBS -= 1
+
+def get_evaluation_dependencies(objects):
+    """Names of objects and everything their poses can depend on: parents, constraint and driver targets"""
+    needed = set()
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if obj is None or obj.name in needed:
+            continue
+        needed.add(obj.name)
+        stack.append(obj.parent)
+        
+        constraints = list(obj.constraints)
+        if obj.type == 'ARMATURE' and obj.pose:
+            for pose_bone in obj.pose.bones:
+                constraints.extend(pose_bone.constraints)
+        for constraint in constraints:
+            stack.append(getattr(constraint, "target", None))
+            stack.append(getattr(constraint, "pole_target", None))
+            # Armature constraints have a list of targets instead
+            stack.extend(target.target for target in getattr(constraint, "targets", ()))
+        
+        for animation_data in (obj.animation_data, getattr(obj.data, "animation_data", None)):
+            if animation_data is None:
+                continue
+            for fcurve in animation_data.drivers:
+                for variable in fcurve.driver.variables:
+                    stack.extend(target.id for target in variable.targets if isinstance(target.id, bpy.types.Object))
+    
+    return needed
+
+def iter_layer_collections(layer_collection):
+    yield layer_collection
+    for child in layer_collection.children:
+        yield from iter_layer_collections(child)
+
+@contextmanager
+def isolated_evaluation(context, objects):
+    """
+    Keep frame_set from evaluating scene content the armatures don't need: exclude the view layer
+    collections without any of their dependencies and turn off the viewport modifiers of meshes they
+    deform. The previous state is restored on exit, also when the export fails or is cancelled.
+    """
+    needed = get_evaluation_dependencies(objects)
+    view_layer = context.view_layer
+    root = view_layer.layer_collection
+    original_excludes = [layer_collection.exclude for layer_collection in iter_layer_collections(root)]
+    original_modifiers = []
+    
+    # Excluding a collection drops its objects' bases, re-including it makes new ones without the hide and select state
+    original_bases = [(obj, obj.hide_get(view_layer=view_layer), obj.select_get(view_layer=view_layer)) for obj in view_layer.objects]
+    original_active = view_layer.objects.active
+    
+    try:
+        stack = list(root.children)
+        while stack:
+            layer_collection = stack.pop()
+            if layer_collection.exclude:
+                continue
+            if any(obj.name in needed for obj in layer_collection.collection.all_objects):
+                stack.extend(layer_collection.children)
+            else:
+                layer_collection.exclude = True
+        
+        rig_names = {obj.name for obj in objects}
+        for obj in context.view_layer.objects:
+            if obj.type != 'MESH' or obj.name in needed:
+                continue
+            deformed = obj.parent is not None and obj.parent.name in rig_names and obj.parent_type == 'ARMATURE'
+            deformed = deformed or any(
+                modifier.type == 'ARMATURE' and modifier.object is not None and modifier.object.name in rig_names
+                for modifier in obj.modifiers
+            )
+            if not deformed:
+                continue
+            for modifier in obj.modifiers:
+                if modifier.show_viewport:
+                    original_modifiers.append(modifier)
+                    modifier.show_viewport = False
+        
+        yield
+        
+    finally:
+        for modifier in original_modifiers:
+            modifier.show_viewport = True
+        
+        # By position in the walk, a collection linked under two parents has a layer collection for each; parents first
+        for layer_collection, exclude in zip(iter_layer_collections(root), original_excludes):
+            if layer_collection.exclude != exclude:
+                layer_collection.exclude = exclude
+        
+        for obj, hidden, selected in original_bases:
+            if obj.hide_get(view_layer=view_layer) != hidden:
+                obj.hide_set(hidden, view_layer=view_layer)
+            if obj.select_get(view_layer=view_layer) != selected:
+                obj.select_set(selected, view_layer=view_layer)
+        if view_layer.objects.active != original_active:
+            view_layer.objects.active = original_active
+
+def read_world_matrices(obj, bone_indices, buffer):
+    """World matrices of the pose bones at bone_indices, read with a single foreach_get into buffer"""
+    # foreach_get hands matrices over column-major
+    obj.pose.bones.foreach_get("matrix", buffer)
+    return np.array(obj.matrix_world) @ buffer.reshape(-1, 4, 4).transpose(0, 2, 1)[bone_indices]
+
+def scale_progress(steps, start, share):
+    """Re-yield the 0..1 progress of the steps generator as start + progress * share, returning its result"""
+    try:
+        while True:
+            try:
+                progress = next(steps)
+            except StopIteration as done:
+                return done.value
+            yield start + progress * share
+    finally:
+        steps.close()
+
+def matrices_to_channels(matrices):
+    """
+    Decompose world matrices into position and XYZ euler rotation, matching Matrix.to_euler()
+    
+    Args:
+        matrices: Array of shape (..., 4, 4)
+    
+    Returns:
+        Array of shape (..., 6) holding pos_x, pos_y, pos_z, rot_x, rot_y, rot_z
+    """
+    rot = matrices[..., :3, :3]
+    axis_lengths = np.linalg.norm(rot, axis=-2, keepdims=True)
+    rot = rot / np.where(axis_lengths > 0.0, axis_lengths, 1.0)
+    
+    cy = np.hypot(rot[..., 0, 0], rot[..., 1, 0])
+    regular = cy > 16.0 * np.finfo(np.float32).eps
+    
+    # Blender picks the smaller of the two equivalent solutions
+    eul1 = np.stack((
+        np.where(regular, np.arctan2(rot[..., 2, 1], rot[..., 2, 2]), np.arctan2(-rot[..., 1, 2], rot[..., 1, 1])),
+        np.arctan2(-rot[..., 2, 0], cy),
+        np.where(regular, np.arctan2(rot[..., 1, 0], rot[..., 0, 0]), 0.0),
+    ), axis=-1)
+    eul2 = np.where(regular[..., None], np.stack((
+        np.arctan2(-rot[..., 2, 1], -rot[..., 2, 2]),
+        np.arctan2(-rot[..., 2, 0], -cy),
+        np.arctan2(-rot[..., 1, 0], -rot[..., 0, 0]),
+    ), axis=-1), eul1)
+    
+    use_first = np.abs(eul1).sum(axis=-1) <= np.abs(eul2).sum(axis=-1)
+    eulers = np.where(use_first[..., None], eul1, eul2)
+    
+    return np.concatenate((matrices[..., :3, 3], eulers), axis=-1)
+
+class MotionProfile:
+    """Wall time of every export phase, per-frame evaluation times and the size of the output"""
+    
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phase_times = {phase: 0.0 for phase, label in PROFILE_PHASES}
+        self.frame_times = {"evaluate": [], "math": []}
+        self.frame_count = 0
+        self.start_sizes = {}
+        self.bytes_patched = 0
+    
+    def add(self, phase, started, frame_count=0):
+        """Add the time since started (a perf_counter value) to phase"""
+        self.phase_times[phase] += time.perf_counter() - started
+        self.frame_count += frame_count
+    
+    def add_frame(self, evaluate_time, math_time):
+        self.frame_times["evaluate"].append(evaluate_time)
+        self.frame_times["math"].append(math_time)
+        self.phase_times["evaluate"] += evaluate_time
+        self.phase_times["math"] += math_time
+        self.frame_count += 1
+    
+    def add_existing_output(self, path):
+        """Remember the size of a file the export appends to or patches, only its growth counts as written"""
+        self.start_sizes.setdefault(path, os.path.getsize(path) if os.path.exists(path) else 0)
+    
+    def get_summary(self, paths):
+        """Totals for the report and the profile sidecar, paths are the files written"""
+        total_time = time.perf_counter() - self.started
+        bytes_written = self.bytes_patched + sum(
+            max(0, os.path.getsize(path) - self.start_sizes.get(path, 0)) for path in paths if os.path.exists(path)
+        )
+        return {
+            "total_seconds": total_time,
+            "phase_seconds": dict(self.phase_times),
+            "frame_count": self.frame_count,
+            "frames_per_second": self.frame_count / total_time if total_time > 0.0 else 0.0,
+            "bytes_written": bytes_written,
+        }
+    
+    def get_report(self, summary):
+        phases = ", ".join(f"{label} {summary['phase_seconds'][phase]:.2f} s" for phase, label in PROFILE_PHASES)
+        return (
+            f"Profile: {summary['total_seconds']:.2f} s total ({phases}), "
+            f"{summary['frames_per_second']:.1f} fps, {summary['bytes_written'] / 1024:.1f} KB written"
+        )
+
+def get_time_histogram(times):
+    """Histogram and percentiles of per-frame times in milliseconds, None without times"""
+    if not times:
+        return None
+    
+    times = np.asarray(times) * 1000.0
+    counts, edges = np.histogram(times, bins=PROFILE_HISTOGRAM_BINS)
+    return {
+        "unit": "ms",
+        "mean": float(times.mean()),
+        "p50": float(np.percentile(times, 50)),
+        "p95": float(np.percentile(times, 95)),
+        "p99": float(np.percentile(times, 99)),
+        "max": float(times.max()),
+        "bin_edges": edges.tolist(),
+        "counts": counts.tolist(),
+    }
+
+def get_normalization_ranges(channels):
+    """Per-bone (min, max) of every channel over all captured frames, widened where a channel is static"""
+    min_values = channels.min(axis=0)
+    max_values = channels.max(axis=0)
+    
+    static = min_values == max_values
+    min_values = np.where(static, min_values - 0.001, min_values)
+    max_values = np.where(static, max_values + 0.001, max_values)
+    
+    return min_values, max_values
+
+def get_keyframe_frames(actions):
+    """Sorted whole frames holding a keyframe in any F-curve of the actions"""
+    key_frames = [np.empty(0, dtype=np.float32)]
+    for action in actions:
+        for fcurve in action.fcurves:
+            points = fcurve.keyframe_points
+            co = np.empty(len(points) * 2, dtype=np.float32)
+            points.foreach_get("co", co)
+            key_frames.append(co[0::2])
+    return np.unique(np.round(np.concatenate(key_frames)).astype(np.int32))
+
+def get_adaptive_rows(frames, channels, keep, tolerance):
+    """
+    Ramer-Douglas-Peucker decimation over all channels at once
+    
+    Between kept rows, the row deviating most from linear interpolation (on any bone and
+    channel) is kept, until every dropped row is reproduced within tolerance.
+    
+    Args:
+        frames: Frame numbers of the rows
+        channels: Array of shape (frames, bones, 6)
+        keep: Boolean mask of rows that are always kept, e.g. keyframes
+        tolerance: Largest absolute deviation allowed for a dropped row
+    
+    Returns:
+        Boolean mask of the rows to keep
+    """
+    values = channels.reshape(len(channels), -1)
+    positions = np.asarray(frames, dtype=np.float64)
+    
+    keep = keep.copy()
+    keep[[0, -1]] = True
+    # Every channel's extremes stay, so ranges derived from the kept rows don't change
+    keep[channels.argmin(axis=0).ravel()] = True
+    keep[channels.argmax(axis=0).ravel()] = True
+    
+    anchors = np.flatnonzero(keep)
+    segments = list(zip(anchors[:-1].tolist(), anchors[1:].tolist()))
+    while segments:
+        start, end = segments.pop()
+        if end - start < 2:
+            continue
+        
+        weights = (positions[start + 1:end] - positions[start]) / (positions[end] - positions[start])
+        interpolated = values[start] + weights[:, None] * (values[end] - values[start])
+        deviation = np.abs(values[start + 1:end] - interpolated).max(axis=1)
+        
+        worst = int(np.argmax(deviation))
+        if deviation[worst] > tolerance:
+            split = start + 1 + worst
+            keep[split] = True
+            segments.append((start, split))
+            segments.append((split, end))
+    
+    return keep
+
+OBJECT_TRANSFORM_PATHS = {
+    "location", "rotation_euler", "rotation_quaternion", "rotation_axis_angle", "scale",
+    "delta_location", "delta_rotation_euler", "delta_rotation_quaternion", "delta_scale",
+}
+
+# Keyframe point properties shaping an F-curve as (name, size, dtype), co first
+KEYFRAME_PROPERTIES = (
+    ("co", 2, np.float32),
+    ("handle_left", 2, np.float32),
+    ("handle_right", 2, np.float32),
+    ("interpolation", 1, np.int32),
+    ("easing", 1, np.int32),
+    ("back", 1, np.float32),
+    ("amplitude", 1, np.float32),
+    ("period", 1, np.float32),
+)
+
+def get_fcurve_fallback_reason(obj):
+    """Return why obj can't be evaluated straight from its F-curves, or None if it can"""
+    if obj.data.pose_position == 'REST':
+        return "armature is in rest position"
+    if obj.parent:
+        return "armature has a parent"
+    if obj.constraints:
+        return "armature has object constraints"
+    
+    for id_data in (obj, obj.data):
+        if id_data.animation_data and id_data.animation_data.drivers:
+            return "rig uses drivers"
+    
+    animation_data = obj.animation_data
+    if animation_data.use_nla and any(not track.mute for track in animation_data.nla_tracks):
+        return "armature has active NLA tracks"
+    if getattr(animation_data, "action_influence", 1.0) < 1.0 or getattr(animation_data, "action_blend_type", 'REPLACE') != 'REPLACE':
+        return "action uses partial influence or blending"
+    
+    for fcurve in animation_data.action.fcurves:
+        if not fcurve.mute and fcurve.data_path in OBJECT_TRANSFORM_PATHS:
+            return "armature object itself is animated"
+    
+    for pose_bone in obj.pose.bones:
+        if pose_bone.constraints:
+            return f"bone '{pose_bone.name}' has constraints"
+        
+        bone = pose_bone.bone
+        if hasattr(bone, "inherit_scale"):
+            inherits_scale = bone.inherit_scale == 'FULL'
+        else:
+            inherits_scale = bone.use_inherit_scale
+        
+        if not (bone.use_inherit_rotation and inherits_scale and bone.use_local_location):
+            return f"bone '{pose_bone.name}' uses non-default parent inheritance"
+    
+    return None
+
+def get_sample_cache_fallback_reason(obj):
+    """Return why the samples of obj may depend on more than get_sample_cache_key hashes, or None"""
+    reason = get_fcurve_fallback_reason(obj)
+    if reason:
+        return reason
+    if any(not fcurve.mute and fcurve.modifiers for fcurve in obj.animation_data.action.fcurves):
+        return "action has F-curve modifiers"
+    return None
+
+def get_sample_cache_key(obj):
+    """
+    Hash of everything the world-space samples of obj depend on once get_sample_cache_fallback_reason
+    is None: the action's F-curves, the rest pose, the unkeyed pose values, the pose position and the
+    object's world matrix
+    """
+    digest = hashlib.sha1(f"bone motion samples {SAMPLE_CACHE_VERSION}".encode())
+    digest.update(np.array(obj.matrix_world, dtype=np.float64).tobytes())
+    
+    animation_data = obj.animation_data
+    digest.update(repr((
+        obj.data.pose_position,
+        getattr(animation_data, "action_influence", 1.0),
+        getattr(animation_data, "action_blend_type", 'REPLACE'),
+        getattr(animation_data, "action_extrapolation", 'HOLD'),
+    )).encode())
+    
+    pose_bones = obj.pose.bones
+    digest.update(repr([(bone.name, bone.parent.name if bone.parent else "", bone.rotation_mode) for bone in pose_bones]).encode())
+    for collection, prop_name, size in (
+        (obj.data.bones, "matrix_local", 16),
+        (pose_bones, "location", 3),
+        (pose_bones, "rotation_quaternion", 4),
+        (pose_bones, "rotation_euler", 3),
+        (pose_bones, "rotation_axis_angle", 4),
+        (pose_bones, "scale", 3),
+    ):
+        values = np.empty(len(collection) * size, dtype=np.float32)
+        collection.foreach_get(prop_name, values)
+        digest.update(values.tobytes())
+    
+    for fcurve in sorted(animation_data.action.fcurves, key=lambda fcurve: (fcurve.data_path, fcurve.array_index)):
+        digest.update(repr((fcurve.data_path, fcurve.array_index, fcurve.mute, fcurve.extrapolation)).encode())
+        points = fcurve.keyframe_points
+        for prop_name, size, dtype in KEYFRAME_PROPERTIES:
+            values = np.empty(len(points) * size, dtype=dtype)
+            points.foreach_get(prop_name, values)
+            digest.update(values.tobytes())
+    
+    return digest.hexdigest()
+
+def load_cached_samples(key, store):
+    """Fill store from a cache entry of key holding all its frames and bones, returns whether one did"""
+    try:
+        entry_names = [name for name in os.listdir(SAMPLE_CACHE_DIR) if name.startswith(key + "_") and name.endswith(".npz")]
+    except OSError:
+        return False
+    
+    for entry_name in entry_names:
+        entry_path = os.path.join(SAMPLE_CACHE_DIR, entry_name)
+        try:
+            with np.load(entry_path) as entry:
+                frames = entry["frames"]
+                bone_indices = {bone_name: bone_idx for bone_idx, bone_name in enumerate(entry["bone_names"].tolist())}
+                rows = np.searchsorted(frames, store.frames)
+                if np.any(rows >= len(frames)) or not np.array_equal(frames[rows], store.frames):
+                    continue
+                if not all(bone_name in bone_indices for bone_name in store.bone_names):
+                    continue
+                store.channels[:] = entry["channels"][rows][:, [bone_indices[bone_name] for bone_name in store.bone_names]]
+            
+            # Marks the entry as recently used for the eviction
+            os.utime(entry_path)
+            return True
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # Written by another version or cut short, drop it
+            if os.path.exists(entry_path):
+                os.remove(entry_path)
+    
+    return False
+
+def save_cached_samples(key, store, max_bytes=SAMPLE_CACHE_MAX_BYTES):
+    """Store the raw samples of store under key, then evict the least recently used entries over max_bytes"""
+    if not store.frame_count:
+        return
+    
+    os.makedirs(SAMPLE_CACHE_DIR, exist_ok=True)
+    entry_path = os.path.join(SAMPLE_CACHE_DIR, f"{key}_{store.frames[0]}_{store.frames[-1]}_{store.frame_count}.npz")
+    
+    # Written aside and moved in place, so a concurrent export never reads half an entry
+    temp_path = f"{entry_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as entry_file:
+        np.savez(entry_file, frames=store.frames, bone_names=np.array(store.bone_names), channels=store.channels)
+    os.replace(temp_path, entry_path)
+    
+    entries = []
+    for entry_name in os.listdir(SAMPLE_CACHE_DIR):
+        entry_stat = os.stat(os.path.join(SAMPLE_CACHE_DIR, entry_name))
+        entries.append((entry_stat.st_mtime, entry_stat.st_size, entry_name))
+    
+    total_bytes = sum(size for mtime, size, entry_name in entries)
+    for mtime, size, entry_name in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        os.remove(os.path.join(SAMPLE_CACHE_DIR, entry_name))
+        total_bytes -= size
+
+def evaluate_fcurve_channel(action, pose_bone, prop_name, size, frames):
+    """Evaluate one transform property of a pose bone for every frame, static values where unkeyed"""
+    data_path = pose_bone.path_from_id(prop_name)
+    current = getattr(pose_bone, prop_name)
+    values = np.empty((len(frames), size))
+    
+    for i in range(size):
+        fcurve = action.fcurves.find(data_path, index=i)
+        if fcurve and not fcurve.mute:
+            values[:, i] = [fcurve.evaluate(frame) for frame in frames]
+        else:
+            values[:, i] = current[i]
+    
+    return values
+
+def quaternions_to_matrices(quats):
+    """(N, 4) w-first quaternions to (N, 3, 3) rotation matrices"""
+    norms = np.linalg.norm(quats, axis=1, keepdims=True)
+    quats = np.where(norms > 0.0, quats / np.where(norms > 0.0, norms, 1.0), [1.0, 0.0, 0.0, 0.0])
+    w, x, y, z = quats.T
+    
+    rot = np.empty((len(quats), 3, 3))
+    rot[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    rot[:, 0, 1] = 2.0 * (x * y - w * z)
+    rot[:, 0, 2] = 2.0 * (x * z + w * y)
+    rot[:, 1, 0] = 2.0 * (x * y + w * z)
+    rot[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    rot[:, 1, 2] = 2.0 * (y * z - w * x)
+    rot[:, 2, 0] = 2.0 * (x * z - w * y)
+    rot[:, 2, 1] = 2.0 * (y * z + w * x)
+    rot[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return rot
+
+def eulers_to_matrices(eulers, order):
+    """(N, 3) euler angles to (N, 3, 3) rotation matrices, order as in Blender's rotation_mode"""
+    rot = np.broadcast_to(np.eye(3), (len(eulers), 3, 3))
+    
+    for axis in order:
+        i = "XYZ".index(axis)
+        angle = eulers[:, i]
+        cos, sin = np.cos(angle), np.sin(angle)
+        j, k = (i + 1) % 3, (i + 2) % 3
+        
+        axis_rot = np.zeros((len(eulers), 3, 3))
+        axis_rot[:, i, i] = 1.0
+        axis_rot[:, j, j] = cos
+        axis_rot[:, k, k] = cos
+        axis_rot[:, j, k] = -sin
+        axis_rot[:, k, j] = sin
+        
+        rot = axis_rot @ rot
+    
+    return rot
+
+def evaluate_basis_matrices(action, pose_bone, frames):
+    """Local (loc @ rot @ scale) pose matrices of a bone for every frame"""
+    loc = evaluate_fcurve_channel(action, pose_bone, "location", 3, frames)
+    scale = evaluate_fcurve_channel(action, pose_bone, "scale", 3, frames)
+    
+    mode = pose_bone.rotation_mode
+    if mode == 'QUATERNION':
+        quats = evaluate_fcurve_channel(action, pose_bone, "rotation_quaternion", 4, frames)
+        rot = quaternions_to_matrices(quats)
+    elif mode == 'AXIS_ANGLE':
+        axis_angle = evaluate_fcurve_channel(action, pose_bone, "rotation_axis_angle", 4, frames)
+        axis = axis_angle[:, 1:]
+        axis_norms = np.linalg.norm(axis, axis=1)
+        # Like Blender's axis_angle_to_quat, a zero axis means no rotation whatever the angle
+        has_axis = axis_norms > 0.0
+        axis = axis / np.where(has_axis, axis_norms, 1.0)[:, None]
+        half_angle = np.where(has_axis, axis_angle[:, 0] * 0.5, 0.0)
+        quats = np.column_stack((np.cos(half_angle), axis * np.sin(half_angle)[:, None]))
+        rot = quaternions_to_matrices(quats)
+    else:
+        eulers = evaluate_fcurve_channel(action, pose_bone, "rotation_euler", 3, frames)
+        rot = eulers_to_matrices(eulers, mode)
+    
+    basis = np.zeros((len(frames), 4, 4))
+    basis[:, :3, :3] = rot * scale[:, None, :]
+    basis[:, :3, 3] = loc
+    basis[:, 3, 3] = 1.0
+    return basis
+
+def evaluate_fcurve_channels(obj, bones, store, bone_offset=0):
+    """
+    Compose world transforms straight from the action's F-curves without touching the scene
+    
+    Args:
+        obj: Armature object, see get_fcurve_fallback_reason for what it must not use
+        bones: Pose bones to evaluate, in store bone order
+        store: MotionSampleStore to fill
+        bone_offset: Store index of the first bone, for stores shared by several armatures
+    """
+    action = obj.animation_data.action
+    frames = store.frames.tolist()
+    world = np.array(obj.matrix_world)
+    store_indices = {bone.name: bone_offset + bone_idx for bone_idx, bone in enumerate(bones)}
+    
+    needed = {}
+    for bone in bones:
+        needed[bone.name] = bone
+        for parent in bone.parent_recursive:
+            needed[parent.name] = parent
+    
+    pending_children = {name: 0 for name in needed}
+    for pose_bone in needed.values():
+        if pose_bone.parent:
+            pending_children[pose_bone.parent.name] += 1
+    
+    # Parents first, each bone's matrices are dropped once its last child is composed
+    pose_matrices = {}
+    for pose_bone in sorted(needed.values(), key=lambda b: len(b.parent_recursive)):
+        rest = np.array(pose_bone.bone.matrix_local)
+        basis = evaluate_basis_matrices(action, pose_bone, frames)
+        
+        if pose_bone.parent:
+            parent_name = pose_bone.parent.name
+            parent_rest = np.array(pose_bone.parent.bone.matrix_local)
+            offset = np.linalg.inv(parent_rest) @ rest
+            matrices = pose_matrices[parent_name] @ offset @ basis
+            
+            pending_children[parent_name] -= 1
+            if not pending_children[parent_name]:
+                del pose_matrices[parent_name]
+        else:
+            matrices = rest @ basis
+        
+        if pose_bone.name in store_indices:
+            store.channels[:, store_indices[pose_bone.name]] = matrices_to_channels(world @ matrices)
+        
+        if pending_children[pose_bone.name]:
+            pose_matrices[pose_bone.name] = matrices
+
+def get_armature_actions(obj, source):
+    """
+    Actions to export for an armature
+    
+    Args:
+        obj: Armature object
+        source: 'ACTIVE', 'ALL_ACTIONS' (every action animating one of its bones) or 'NLA_STRIPS'
+    
+    Returns:
+        List of actions in export order, without duplicates
+    """
+    animation_data = obj.animation_data
+    
+    if source == 'ACTIVE':
+        return [animation_data.action] if animation_data and animation_data.action else []
+    
+    if source == 'NLA_STRIPS':
+        actions = []
+        if animation_data:
+            for track in animation_data.nla_tracks:
+                for strip in track.strips:
+                    if strip.action and strip.action not in actions:
+                        actions.append(strip.action)
+        return actions
+    
+    bone_names = set(obj.pose.bones.keys())
+    prefix = 'pose.bones["'
+    
+    def animates_bones(action):
+        for fcurve in action.fcurves:
+            if fcurve.data_path.startswith(prefix) and fcurve.data_path[len(prefix):].split('"]')[0] in bone_names:
+                return True
+        return False
+    
+    return [action for action in bpy.data.actions if animates_bones(action)]
+
+def get_bone_type(bone_name):
+    """Guess the anatomical group of a bone from its name"""
+    name_lower = bone_name.lower()
+    
+    if "arm" in name_lower or "hand" in name_lower or "finger" in name_lower or "thumb" in name_lower:
+        return "arm"
+    elif "leg" in name_lower or "foot" in name_lower or "toe" in name_lower:
+        return "leg"
+    elif "spine" in name_lower or "neck" in name_lower:
+        return "spine"
+    elif "head" in name_lower or "face" in name_lower or "jaw" in name_lower:
+        return "head"
+    elif "hip" in name_lower or "pelvis" in name_lower:
+        return "hip"
+    return "other"
+
+def get_bone_type_index(bone_names):
+    """Bone names grouped by anatomical type"""
+    bone_groups = {}
+    for bone_name in bone_names:
+        bone_groups.setdefault(get_bone_type(bone_name), []).append(bone_name)
+    return bone_groups
+
+def get_bone_collections(obj):
+    """Bone collections of obj (Blender 4.0+, nested ones included from 4.1), bone groups before"""
+    armature = obj.data
+    if hasattr(armature, "collections"):
+        return list(getattr(armature, "collections_all", armature.collections))
+    return list(obj.pose.bone_groups)
+
+def get_bone_collection_bone_names(obj, collection):
+    """Names of the bones in a bone collection and its child collections, or in a bone group"""
+    if hasattr(collection, "bones"):
+        names = {bone.name for bone in collection.bones}
+        for child in getattr(collection, "children", ()):
+            names |= get_bone_collection_bone_names(obj, child)
+        return names
+    return {pose_bone.name for pose_bone in obj.pose.bones if pose_bone.bone_group == collection}
+
+class BoneHierarchy:
+    """Names, indices and children of an armature's pose bones, to resolve a bone selection in one pass"""
+    
+    def __init__(self, pose_bones):
+        self.names = [bone.name for bone in pose_bones]
+        self.indices = {bone_name: bone_idx for bone_idx, bone_name in enumerate(self.names)}
+        self.children = [[] for bone_name in self.names]
+        for bone_idx, bone in enumerate(pose_bones):
+            if bone.parent is not None:
+                self.children[self.indices[bone.parent.name]].append(bone_idx)
+    
+    def match(self, pattern, use_regex=False):
+        """Indices of the bones matching comma separated glob patterns, or a regular expression searched in the name"""
+        if use_regex:
+            matcher = re.compile(pattern).search
+        else:
+            globs = [glob.strip() for glob in pattern.split(",") if glob.strip()]
+            if not globs:
+                return []
+            matcher = re.compile("|".join(fnmatch.translate(glob) for glob in globs)).match
+        
+        return [bone_idx for bone_idx, bone_name in enumerate(self.names) if matcher(bone_name)]
+    
+    def find(self, bone_names):
+        """Indices of the bones named in bone_names, in pose bone order"""
+        return sorted(self.indices[bone_name] for bone_name in bone_names if bone_name in self.indices)
+    
+    def subtree(self, root_name):
+        """Indices of root_name and all its descendants, in pose bone order"""
+        found = []
+        stack = [self.indices[root_name]]
+        while stack:
+            bone_idx = stack.pop()
+            found.append(bone_idx)
+            stack.extend(self.children[bone_idx])
+        return sorted(found)
 
 def get_animation_range(context):
     obj = context.active_object
@@ -48,6 +1635,205 @@ def get_animation_range(context):
         return (int(frame_range[0]), int(frame_range[1]))
     return (1, 250)
 
+# Watched exports by armature name, see MotionWatch
+MOTION_WATCHES = {}
+
+class MotionWatch:
+    """
+    Raw (world-space) samples, keyframe snapshot and operator settings of a watched export.
+    When the action's keyframes change, the export is run again and resamples only the
+    frames within dirty_window.
+    """
+    
+    def __init__(self, store, keyframes, settings):
+        self.store = store
+        self.keyframes = keyframes
+        self.settings = settings
+        self.dirty_window = None
+        self.changed_at = 0.0
+        self.timer_pending = False
+        self.refreshing = False
+    
+    def matches(self, store):
+        return self.store.bone_names == store.bone_names and np.array_equal(self.store.frames, store.frames)
+    
+    def get_dirty_rows(self):
+        start, end = self.dirty_window
+        return np.flatnonzero((self.store.frames >= start) & (self.store.frames <= end))
+
+def snapshot_keyframes(action):
+    """
+    Keyframe points of every F-curve as (points, mute, modifier count, extrapolation), keyed by
+    (data_path, index). Points hold one row of KEYFRAME_PROPERTIES per key, the frame first.
+    """
+    keyframes = {}
+    for fcurve in action.fcurves:
+        points = fcurve.keyframe_points
+        columns = []
+        for prop_name, size, dtype in KEYFRAME_PROPERTIES:
+            values = np.empty(len(points) * size, dtype=dtype)
+            points.foreach_get(prop_name, values)
+            columns.append(values.reshape(-1, size).astype(np.float32))
+        keyframes[(fcurve.data_path, fcurve.array_index)] = (np.hstack(columns), fcurve.mute, len(fcurve.modifiers), fcurve.extrapolation)
+    return keyframes
+
+def get_changed_keyframe_spans(old_points, new_points):
+    """Frame spans (old curve, new curve) shaped by the keys that differ between two versions of a curve"""
+    count = min(len(old_points), len(new_points))
+    same = np.all(old_points[:count] == new_points[:count], axis=1)
+    prefix = count if same.all() else int(np.argmin(same))
+    same = np.all(old_points[len(old_points) - count:] == new_points[len(new_points) - count:], axis=1)[::-1]
+    suffix = min(count if same.all() else int(np.argmin(same)), count - prefix)
+    
+    spans = []
+    for points in (old_points, new_points):
+        # A key shapes the curve from the key before it to the key after it, the end keys also the extrapolation
+        last = len(points) - 1 - suffix
+        start = points[prefix - 1, 0] if prefix > 0 else -np.inf
+        end = points[last + 1, 0] if last + 1 < len(points) else np.inf
+        spans.append((start, end))
+    return spans
+
+def get_dirty_frame_window(old_keyframes, new_keyframes):
+    """
+    Frames affected by the edits between two keyframe snapshots
+    
+    Returns:
+        (start, end) frame window, open ended (-inf / inf) where edits reach past the keys,
+        None if no keyframe changed
+    """
+    start, end = np.inf, -np.inf
+    
+    for key in old_keyframes.keys() | new_keyframes.keys():
+        if key not in old_keyframes or key not in new_keyframes:
+            return -np.inf, np.inf
+        
+        old_points, *old_settings = old_keyframes[key]
+        new_points, *new_settings = new_keyframes[key]
+        new_modifiers = new_settings[1]
+        if old_settings != new_settings:
+            # Mute, modifiers and extrapolation change the curve beyond its keys
+            return -np.inf, np.inf
+        if old_points.shape == new_points.shape and np.array_equal(old_points, new_points):
+            continue
+        if new_modifiers:
+            # Cycles, noise and friends carry a key's change across the whole timeline
+            return -np.inf, np.inf
+        
+        for span_start, span_end in get_changed_keyframe_spans(old_points, new_points):
+            start = min(start, span_start)
+            end = max(end, span_end)
+    
+    return None if start > end else (start, end)
+
+def refresh_motion_watch(obj_name):
+    """Timer callback: once edits settle, re-run a watched export for the frames they touched"""
+    watch = MOTION_WATCHES.get(obj_name)
+    if watch is None:
+        return None
+    
+    remaining = watch.changed_at + WATCH_DEBOUNCE_SECONDS - time.perf_counter()
+    if remaining > 0.0:
+        return remaining
+    watch.timer_pending = False
+    
+    obj = bpy.data.objects.get(obj_name)
+    if obj is None or not obj.animation_data or not obj.animation_data.action:
+        del MOTION_WATCHES[obj_name]
+        return None
+    
+    watch.dirty_window = get_dirty_frame_window(watch.keyframes, snapshot_keyframes(obj.animation_data.action))
+    if watch.dirty_window is None:
+        return None
+    
+    # The export reads the active object, the refresh re-registers the watch with fresh samples
+    view_layer = bpy.context.view_layer
+    active = view_layer.objects.active
+    watch.refreshing = True
+    try:
+        view_layer.objects.active = obj
+        bpy.ops.export.bone_motion_data(**watch.settings)
+    finally:
+        view_layer.objects.active = active
+        watch.refreshing = False
+    return None
+
+@bpy.app.handlers.persistent
+def motion_watch_depsgraph_update(scene, depsgraph):
+    if not MOTION_WATCHES or not depsgraph.id_type_updated('ACTION'):
+        return
+    
+    # Debounced: dragging a key fires an update per mouse move, the refresh waits for a pause
+    for obj_name, watch in MOTION_WATCHES.items():
+        if watch.refreshing:
+            continue
+        watch.changed_at = time.perf_counter()
+        if not watch.timer_pending:
+            watch.timer_pending = True
+            bpy.app.timers.register(partial(refresh_motion_watch, obj_name), first_interval=WATCH_DEBOUNCE_SECONDS)
+
+# Live outputs by kind ('OSC', 'SHARED_MEMORY'), see MotionLiveStream
+LIVE_STREAMS = {}
+
+class MotionLiveStream:
+    """Writes the current pose of one armature to a writer on every frame change, optionally normalized"""
+    
+    def __init__(self, obj, bones, writer, ranges=None):
+        pose_bones = obj.pose.bones
+        self.obj_name = obj.name
+        self.bone_indices = [pose_bones.find(bone.name) for bone in bones]
+        self.buffer = np.empty(len(pose_bones) * 16, dtype=np.float32)
+        self.channels = np.empty((len(bones), len(CHANNEL_NAMES)), dtype=np.float32)
+        self.writer = writer
+        
+        self.min_values = None
+        if ranges is not None:
+            self.min_values = ranges[0]
+            self.scale = 2.0 / (ranges[1] - ranges[0])
+    
+    def send(self, frame):
+        """Write the pose of the current frame, False once the armature is gone or its bones changed"""
+        obj = bpy.data.objects.get(self.obj_name)
+        if obj is None or obj.type != 'ARMATURE' or len(obj.pose.bones) * 16 != len(self.buffer):
+            return False
+        
+        channels = matrices_to_channels(read_world_matrices(obj, self.bone_indices, self.buffer))
+        if self.min_values is not None:
+            # Same mapping as MotionSampleStore.normalize, into the preallocated frame buffer
+            np.subtract(channels, self.min_values, out=self.channels)
+            self.channels *= self.scale
+            self.channels -= 1.0
+            np.clip(self.channels, -1.0, 1.0, out=self.channels)
+            channels = self.channels
+        
+        self.writer.write_frame(frame, channels)
+        return True
+    
+    def close(self):
+        self.writer.finish()
+
+def stop_live_stream(kind):
+    stream = LIVE_STREAMS.pop(kind, None)
+    if stream is not None:
+        stream.close()
+    return stream is not None
+
+@bpy.app.handlers.persistent
+def live_stream_frame_change(scene, *args):
+    if SCENE_SCRUBS:
+        # An export sampling the timeline, consumers only follow the frames the user is on
+        return
+    for kind, stream in list(LIVE_STREAMS.items()):
+        if not stream.send(scene.frame_current):
+            stop_live_stream(kind)
+
+@bpy.app.handlers.persistent
+def motion_load_post(*args):
+    BONE_ENUM_CACHE.clear()
+    MOTION_WATCHES.clear()
+    for kind in list(LIVE_STREAMS):
+        stop_live_stream(kind)
+
 class BONE_OT_export_motion_data(Operator, ExportHelper):
     bl_idname = "export.bone_motion_data"
     bl_label = "Export Bone Motion Data"
@@ -58,7 +1844,7 @@ class BONE_OT_export_motion_data(Operator, ExportHelper):
     )
     
     filter_glob: StringProperty(
-        default="*.csv;*.json",
+        default="*.csv;*.json;*.jsonl;*.npy;*.bmotion;*.sqlite;*.bmq;*.gz;*.xz;*.bz2",
         options={'HIDDEN'},
         maxlen=255,
     )
@@ -66,11 +1852,68 @@ class BONE_OT_export_motion_data(Operator, ExportHelper):
     export_format: EnumProperty(
         name="Format",
         description="Choose the export format",
+        items=EXPORT_FORMAT_ITEMS,
+        default='CSV',
+        update=update_export_filepath
+    )
+    
+    compression: EnumProperty(
+        name="Compression",
+        description="Compress CSV/JSON output while it is written",
+        items=COMPRESSION_ITEMS,
+        default='NONE',
+        update=update_export_filepath
+    )
+    
+    compression_level: IntProperty(
+        name="Level",
+        description="Compression level (1 = fastest, 9 = smallest)",
+        default=6,
+        min=1,
+        max=9
+    )
+    
+    include_bone_index: BoolProperty(
+        name="Bone Type Index",
+        description="Add a by_bone_type index listing bone names per anatomical group",
+        default=True
+    )
+    
+    action_source: EnumProperty(
+        name="Actions",
+        description="Which actions of the armature to export",
+        items=(
+            ('ACTIVE', "Active Action", "Export the armature's current action"),
+            ('ALL_ACTIONS', "All Actions", "Export every action in the file that animates this armature's bones"),
+            ('NLA_STRIPS', "NLA Strips", "Export the action of every NLA strip on the armature"),
+        ),
+        default='ACTIVE'
+    )
+    
+    multi_action_output: EnumProperty(
+        name="Output",
+        description="Where to write the actions when exporting several",
+        items=(
+            ('SEPARATE', "One File per Action", "Write each action to its own file named after the action"),
+            ('COMBINED', "Single File", "Write all actions into one file (CSV, JSON, JSON Lines and SQLite)"),
+        ),
+        default='SEPARATE'
+    )
+    
+    use_selected_armatures: BoolProperty(
+        name="All Selected Armatures",
+        description="Export every selected armature, capturing all of them from a single evaluation of each frame",
+        default=False
+    )
+    
+    multi_armature_output: EnumProperty(
+        name="Output",
+        description="Where to write the armatures when exporting several",
         items=(
-            ('CSV', "CSV", "Comma-separated values format"),
-            ('JSON', "JSON", "JavaScript Object Notation format")
+            ('SEPARATE', "One File per Armature", "Write each armature to its own file named after the armature"),
+            ('COMBINED', "Single File", "Write all armatures into one file, bone names prefixed with \"<armature>/\""),
         ),
-        default='CSV'
+        default='SEPARATE'
     )
     
     show_hidden_bones: BoolProperty(
@@ -79,12 +1922,42 @@ class BONE_OT_export_motion_data(Operator, ExportHelper):
         default=False
     )
     
+    bone_selection: EnumProperty(
+        name="Bones",
+        description="How the bones to export are chosen",
+        items=(
+            ('BONE', "Bone", "All bones or the single bone chosen below"),
+            ('PATTERN', "Name Pattern", "Bones whose names match glob patterns or a regular expression"),
+            ('COLLECTION', "Collection", "Bones in a bone collection (bone group before Blender 4.0)"),
+            ('SUBTREE', "Subtree", "The bone chosen below and all its descendants"),
+        ),
+        default='BONE'
+    )
+    
     bone_to_export: EnumProperty(
         name="Select Bone",
         description="Choose which bone's motion to export",
         items=get_bones_callback
     )
     
+    bone_pattern: StringProperty(
+        name="Pattern",
+        description="Comma separated glob patterns matched against bone names, e.g. \"*Hand*, *Thumb*\"",
+        default="*"
+    )
+    
+    use_regex: BoolProperty(
+        name="Regex",
+        description="Treat the pattern as a regular expression searched in the bone names",
+        default=False
+    )
+    
+    bone_collection: EnumProperty(
+        name="Collection",
+        description="Bone collection (or bone group) to export",
+        items=get_bone_collections_callback
+    )
+    
     use_custom_range: BoolProperty(
         name="Custom Frame Range",
         description="Use custom start and end frames instead of the full animation",
@@ -95,30 +1968,111 @@ class BONE_OT_export_motion_data(Operator, ExportHelper):
         name="Start Frame",
         description="First frame to export",
         default=1,
-        min=1
+        soft_min=1
     )
     
     end_frame: IntProperty(
         name="End Frame",
         description="Last frame to export",
         default=250,
-        min=1
+        soft_min=1
+    )
+    
+    sample_all_frames: BoolProperty(
+        name="Export All Frames",
+        description="Export every single frame (may result in large files)",
+        default=False
+    )
+    
+    sampling_mode: EnumProperty(
+        name="Sampling",
+        description="How the frames to export are chosen",
+        items=(
+            ('FIXED', "Fixed Step", "Export every Frame Step frames (about 500 rows at most unless Export All Frames is on)"),
+            ('ADAPTIVE', "Adaptive", "Sample every Frame Step frames, then drop the samples that linear interpolation reproduces within the tolerance"),
+        ),
+        default='FIXED'
+    )
+    
+    adaptive_tolerance: FloatProperty(
+        name="Tolerance",
+        description="Largest deviation allowed for a dropped sample, in exported units (normalized, or world units and radians)",
+        default=0.001,
+        min=0.0,
+        precision=4
+    )
+    
+    keep_keyframes: BoolProperty(
+        name="Keep Keyframes",
+        description="Always export keyed frames, turn off for baked motion with a key on every frame",
+        default=True
+    )
+    
+    coordinate_system: EnumProperty(
+        name="Coordinate System",
+        description="Choose the coordinate system for export",
+        items=COORDINATE_SYSTEM_ITEMS,
+        default='NORMALIZED'
+    )
+    
+    evaluation_mode: EnumProperty(
+        name="Evaluation",
+        description="How bone transforms are evaluated for each frame",
+        items=EVALUATION_MODE_ITEMS,
+        default='SCENE'
+    )
+    
+    isolate_evaluation: BoolProperty(
+        name="Isolate Armature",
+        description="While sampling, exclude the collections the armature doesn't depend on and turn off the viewport "
+                    "modifiers of the meshes it deforms, everything is restored afterwards",
+        default=False
+    )
+    
+    use_sample_cache: BoolProperty(
+        name="Sample Cache",
+        description="Keep the raw samples on disk and reuse them while the action, rest pose and armature transform "
+                    "are unchanged, so exports that only change output options skip evaluation",
+        default=False
+    )
+    
+    shard_count: IntProperty(
+        name="Parallel Processes",
+        description="Split the frame range over this many background Blender processes (1 = evaluate in this session)",
+        default=1,
+        min=1,
+        max=64
+    )
+    
+    use_progress: BoolProperty(
+        name="Show Progress",
+        description="Export in small time slices with a progress bar and ETA, the UI stays responsive and Esc cancels",
+        default=True
+    )
+    
+    keep_partial: BoolProperty(
+        name="Keep Partial Output",
+        description="When cancelled, finish the files with the frames sampled so far instead of deleting them",
+        default=False
     )
     
-    sample_all_frames: BoolProperty(
-        name="Export All Frames",
-        description="Export every single frame (may result in large files)",
+    watch_changes: BoolProperty(
+        name="Watch for Changes",
+        description="Keep the samples and re-export only the frames touched by keyframe edits of the active action, "
+                    "until File > Export > Stop Watching Bone Motion",
         default=False
     )
     
-    coordinate_system: EnumProperty(
-        name="Coordinate System",
-        description="Choose the coordinate system for export",
-        items=(
-            ('NORMALIZED', "Normalize to [-1, 1]", "Normalize values to range [-1, 1] for Pd-L2Ork"),
-            ('WORLD', "World Coordinates", "Export raw world space coordinates"),
-        ),
-        default='NORMALIZED'
+    use_profiling: BoolProperty(
+        name="Profile",
+        description="Time the export phases and report them with frames per second and bytes written",
+        default=False
+    )
+    
+    write_profile: BoolProperty(
+        name="Write Profile",
+        description="Also write the timings with per-frame evaluation time histograms to <file>.profile.json",
+        default=False
     )
     
     frame_step: IntProperty(
@@ -138,6 +2092,8 @@ class BONE_OT_export_motion_data(Operator, ExportHelper):
     
     def invoke(self, context, event):
         self.update_extension(context)
+        # Only exports started from the file browser run modal, scripted calls return when the file is written
+        self._invoked = True
         
         start, end = get_animation_range(context)
         self.start_frame = start
@@ -145,10 +2101,15 @@ class BONE_OT_export_motion_data(Operator, ExportHelper):
         return super().invoke(context, event)
     
     def update_extension(self, context):
-        if self.export_format == 'CSV':
-            self.filename_ext = ".csv"
-        elif self.export_format == 'JSON':
-            self.filename_ext = ".json"
+        self.filename_ext = FORMAT_EXTENSIONS[self.export_format]
+        if self.export_format in TEXT_FORMATS and self.compression != 'NONE':
+            self.filename_ext += COMPRESSION_EXTENSIONS[self.compression]
+    
+    def check(self, context):
+        # ExportHelper.check only swaps the last suffix, "take.csv.gz" would become "take.csv.csv.gz"
+        filepath = self.filepath
+        update_export_filepath(self, context)
+        return self.filepath != filepath
     
     def draw(self, context):
         layout = self.layout
@@ -159,15 +2120,43 @@ class BONE_OT_export_motion_data(Operator, ExportHelper):
         box = layout.box()
         box.label(text="Export Format:")
         box.prop(self, "export_format", expand=True)
+        if self.export_format in {'JSON', 'NDJSON'}:
+            box.prop(self, "include_bone_index")
+        if self.export_format in TEXT_FORMATS:
+            row = box.row()
+            row.prop(self, "compression")
+            sub = row.row()
+            sub.enabled = self.compression != 'NONE'
+            sub.prop(self, "compression_level")
         
         box = layout.box()
         box.label(text="Bone Selection:")
+        box.prop(self, "bone_selection", text="")
         box.prop(self, "show_hidden_bones")
-        box.prop(self, "bone_to_export")
+        if self.bone_selection == 'PATTERN':
+            row = box.row()
+            row.prop(self, "bone_pattern")
+            row.prop(self, "use_regex")
+        elif self.bone_selection == 'COLLECTION':
+            box.prop(self, "bone_collection")
+        else:
+            box.prop(self, "bone_to_export")
         
-        if self.bone_to_export == "ALL":
+        if self.bone_selection == 'BONE' and self.bone_to_export == "ALL":
             box.label(text="Note: Exporting all bones will create a wider data structure", icon='INFO')
         
+        box = layout.box()
+        box.label(text="Armatures:")
+        box.prop(self, "use_selected_armatures")
+        if self.use_selected_armatures:
+            box.prop(self, "multi_armature_output", expand=True)
+        
+        box = layout.box()
+        box.label(text="Actions:")
+        box.prop(self, "action_source", text="")
+        if self.action_source != 'ACTIVE':
+            box.prop(self, "multi_action_output", expand=True)
+        
         box = layout.box()
         box.label(text="Frame Range:")
         box.prop(self, "use_custom_range")
@@ -179,298 +2168,1020 @@ class BONE_OT_export_motion_data(Operator, ExportHelper):
         box = layout.box()
         box.label(text="Export Options:")
         box.prop(self, "sample_all_frames")
+        box.prop(self, "sampling_mode", expand=True)
+        if self.sampling_mode == 'ADAPTIVE':
+            row = box.row()
+            row.prop(self, "adaptive_tolerance")
+            row.prop(self, "keep_keyframes")
         
         box.label(text="Coordinate System:")
         box.prop(self, "coordinate_system", expand=True)
         
+        box.label(text="Evaluation:")
+        box.prop(self, "evaluation_mode", expand=True)
+        row = box.row()
+        row.prop(self, "isolate_evaluation")
+        row.prop(self, "use_sample_cache")
+        sub = box.row()
+        sub.enabled = self.evaluation_mode == 'SCENE'
+        sub.prop(self, "shard_count")
+        
+        row = box.row()
+        row.prop(self, "use_progress")
+        sub = row.row()
+        sub.enabled = self.use_progress
+        sub.prop(self, "keep_partial")
+        box.prop(self, "watch_changes")
+        
+        row = box.row()
+        row.prop(self, "use_profiling")
+        sub = row.row()
+        sub.enabled = self.use_profiling
+        sub.prop(self, "write_profile")
+        
         box = layout.box()
         row = box.row()
         row.prop(self, "frame_step")
         row.prop(self, "precision")
     
+    # Modal export state, see execute
+    _steps = None
+    _timer = None
+    _started = 0.0
+    _progress = 0.0
+    _cancel_requested = False
+    _invoked = False
+    _output_paths = ()
+    _profile = None
+    
     def execute(self, context):
         self.update_extension(context)
+        self._cancel_requested = False
+        self._output_paths = []
+        self._profile = MotionProfile() if self.use_profiling else None
+        self._steps = self.export_steps(context)
+        
+        if not self._invoked or not self.use_progress or bpy.app.background or context.window is None:
+            return self.run_steps()
+        
+        # Sample in time slices from timer events so the UI keeps drawing in between
+        wm = context.window_manager
+        self._started = time.perf_counter()
+        self._progress = 0.0
+        self._timer = wm.event_timer_add(MODAL_TIMER_INTERVAL, window=context.window)
+        wm.progress_begin(0, 100)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            return self.cancel_export(context)
         
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        deadline = time.perf_counter() + MODAL_SLICE_SECONDS
+        try:
+            while time.perf_counter() < deadline:
+                self._progress = next(self._steps)
+        except StopIteration as done:
+            self.end_modal(context)
+            return done.value
+        except Exception:
+            self.end_modal(context)
+            raise
+        
+        elapsed = time.perf_counter() - self._started
+        status = f"Exporting bone motion: {self._progress:.0%}"
+        if self._progress > 0.0:
+            remaining = elapsed * (1.0 - self._progress) / self._progress
+            status += f", about {int(remaining) // 60}:{int(remaining) % 60:02d} left"
+        
+        context.window_manager.progress_update(int(self._progress * 100))
+        context.workspace.status_text_set(status + " (Esc to cancel)")
+        return {'RUNNING_MODAL'}
+    
+    def cancel(self, context):
+        # Blender is tearing the operator down (e.g. the file is closed), drop everything
+        self._steps.close()
+        self.end_modal(context)
+    
+    def cancel_export(self, context):
+        if self.keep_partial:
+            # Sampling loops stop at the next frame and the writers finish with what was sampled
+            self._cancel_requested = True
+            if self.run_steps() == {'FINISHED'}:
+                self.report({'WARNING'}, "Export cancelled, the frames sampled so far were written")
+        else:
+            # Closing the steps restores the scene and closes the files, unfinished output is removed
+            self._steps.close()
+            for path in self._output_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+            self.report({'WARNING'}, "Export cancelled")
+        
+        self.end_modal(context)
+        return {'CANCELLED'}
+    
+    def end_modal(self, context):
+        wm = context.window_manager
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        if context.workspace:
+            context.workspace.status_text_set(None)
+    
+    def run_steps(self):
+        """Drive the export steps to the end and return the operator result"""
+        while True:
+            try:
+                next(self._steps)
+            except StopIteration as done:
+                return done.value
+    
+    def cancel_empty_export(self):
+        """Result of an export cancelled before any frame was sampled, the files opened for it are removed"""
+        for path in self._output_paths:
+            if os.path.exists(path):
+                os.remove(path)
+        self.report({'WARNING'}, "Export cancelled")
+        return {'CANCELLED'}
+    
+    def export_steps(self, context):
+        """
+        Generator doing the whole export. Yields the progress (0..1) after every sampled or
+        written frame, so it can run in one go or in modal time slices, and returns the
+        operator result.
+        """
         filepath = self.filepath
         if not filepath.endswith(self.filename_ext):
-            filepath += self.filename_ext
+            filepath = strip_export_extension(filepath) + self.filename_ext
         
         obj = context.active_object
         if not obj or obj.type != 'ARMATURE':
             self.report({'ERROR'}, "Active object must be an armature")
             return {'CANCELLED'}
         
-        if not obj.animation_data or not obj.animation_data.action:
-            self.report({'ERROR'}, f"No motion data found on armature {obj.name}")
+        if self.use_custom_range and self.start_frame > self.end_frame:
+            self.report({'ERROR'}, "Start frame must be less than or equal to end frame")
             return {'CANCELLED'}
         
-        pose_bones = obj.pose.bones
-        bones_to_export = []
+        if self.bone_selection == 'PATTERN' and self.use_regex:
+            try:
+                re.compile(self.bone_pattern)
+            except re.error as e:
+                self.report({'ERROR'}, f"Invalid bone pattern: {e}")
+                return {'CANCELLED'}
         
-        if self.bone_to_export == "ALL":
-            for bone in pose_bones:
-                if not self.show_hidden_bones and bone.bone.hide:
-                    continue
-                bones_to_export.append(bone)
-        else:
-            if self.bone_to_export in pose_bones:
-                bones_to_export = [pose_bones[self.bone_to_export]]
+        if self.use_selected_armatures:
+            armatures = [obj] + [other for other in context.selected_objects if other.type == 'ARMATURE' and other != obj]
+            if len(armatures) > 1:
+                return (yield from self.export_armatures(context, armatures, filepath))
+        
+        actions = get_armature_actions(obj, self.action_source)
+        if not actions:
+            self.report({'ERROR'}, f"No motion data found on armature {obj.name}")
+            return {'CANCELLED'}
+        
+        bones_to_export = self.select_bones(obj)
+        if bones_to_export is None:
+            if self.bone_selection == 'COLLECTION':
+                self.report({'ERROR'}, f"Bone collection '{self.bone_collection}' not found")
             else:
                 self.report({'ERROR'}, f"Selected bone '{self.bone_to_export}' not found")
-                return {'CANCELLED'}
+            return {'CANCELLED'}
         
         if not bones_to_export:
             self.report({'ERROR'}, "No bones found to export")
             return {'CANCELLED'}
         
-        if self.use_custom_range:
-            start_frame = self.start_frame
-            end_frame = self.end_frame
-        else:
-            action = obj.animation_data.action
-            frame_range = action.frame_range
-            start_frame = int(frame_range[0])
-            end_frame = int(frame_range[1])
-        
-        if start_frame > end_frame:
-            self.report({'ERROR'}, "Start frame must be less than or equal to end frame")
-            return {'CANCELLED'}
-        
-        original_frame = context.scene.frame_current
+        if self.watch_changes and self.action_source != 'ACTIVE':
+            self.report({'WARNING'}, "Watching follows the active action only, not watching this export")
         
-        if self.sample_all_frames:
-            sample_interval = self.frame_step
-        else:
-            sample_interval = max(self.frame_step, (end_frame - start_frame) // 500)
+        bone_names = [bone.name for bone in bones_to_export]
+        combined = len(actions) > 1 and self.multi_action_output == 'COMBINED'
+        if combined and self.export_format not in COMBINED_FORMATS:
+            self.report({'WARNING'}, "This format holds a single action, writing one file per action")
+            combined = False
         
-        frames_to_sample = range(start_frame, end_frame + 1, sample_interval)
+        action_paths = [filepath] if len(actions) == 1 else self.get_suffixed_filepaths(filepath, [action.name for action in actions])
         
-        bone_data = {}
+        # All Actions also finds actions by bone names on armatures that never had animation data
+        created_animation_data = obj.animation_data is None
+        if created_animation_data:
+            obj.animation_data_create()
         
-        if self.coordinate_system == 'NORMALIZED':
-            for bone in bones_to_export:
-                positions = []
-                rotations = []
-                
-                sample_steps = max(1, len(frames_to_sample) // 20)
-                for frame_idx, frame in enumerate(frames_to_sample):
-                    if frame_idx % sample_steps != 0 and frame != frames_to_sample[-1]:
-                        continue
-                    
-                    context.scene.frame_set(frame)
-                    context.view_layer.update()
-                    
-                    bone_matrix = obj.matrix_world @ bone.matrix
-                    
-                    loc = bone_matrix.to_translation()
-                    positions.append([loc.x, loc.y, loc.z])
-                    
-                    rot = bone_matrix.to_euler()
-                    rotations.append([rot.x, rot.y, rot.z])
-                
-                min_pos = [min(p[i] for p in positions) for i in range(3)]
-                max_pos = [max(p[i] for p in positions) for i in range(3)]
-                min_rot = [min(r[i] for r in rotations) for i in range(3)]
-                max_rot = [max(r[i] for r in rotations) for i in range(3)]
-                
-                for i in range(3):
-                    if min_pos[i] == max_pos[i]:
-                        min_pos[i] -= 0.001
-                        max_pos[i] += 0.001
-                    if min_rot[i] == max_rot[i]:
-                        min_rot[i] -= 0.001
-                        max_rot[i] += 0.001
-                
-                bone_data[bone.name] = {
-                    'min_pos': min_pos,
-                    'max_pos': max_pos,
-                    'min_rot': min_rot,
-                    'max_rot': max_rot
-                }
+        original_frame = context.scene.frame_current
+        animation_data = obj.animation_data
+        original_action = animation_data.action
+        original_use_nla = animation_data.use_nla
         
         try:
-            animation_data = []
-            frames_data = {}
+            if self.action_source != 'ACTIVE':
+                # Every action is evaluated on its own, without the NLA stack on top
+                animation_data.use_nla = False
             
-            for frame in frames_to_sample:
-                context.scene.frame_set(frame)
-                context.view_layer.update()
-                
-                frame_data = {"frame": frame}
-                frame_bones_data = {}
+            written = []
+            exported_count = 0
+            with ExitStack() as combined_stack:
+                if self.isolate_evaluation:
+                    combined_stack.enter_context(isolated_evaluation(context, [obj]))
+                if combined:
+                    outfile = combined_stack.enter_context(self.open_output(filepath))
+                    combined_writer = self.create_combined_writer(outfile, bone_names, [action.name for action in actions])
+                    written.append(filepath)
                 
-                for bone in bones_to_export:
-                    bone_matrix = obj.matrix_world @ bone.matrix
+                for action_idx, action in enumerate(actions):
+                    if self._cancel_requested:
+                        break
                     
-                    loc = bone_matrix.to_translation()
-                    rot = bone_matrix.to_euler()
+                    animation_data.action = action
+                    frames_to_sample, sample_interval = self.get_sample_frames([action])
                     
-                    if self.coordinate_system == 'WORLD':
-                        bone_values = {
-                            "position": {
-                                "x": round(loc.x, self.precision),
-                                "y": round(loc.y, self.precision),
-                                "z": round(loc.z, self.precision)
-                            },
-                            "rotation": {
-                                "x": round(rot.x, self.precision),
-                                "y": round(rot.y, self.precision),
-                                "z": round(rot.z, self.precision)
-                            }
-                        }
-                    else:  # NORMALIZED
-                        min_pos = bone_data[bone.name]['min_pos']
-                        max_pos = bone_data[bone.name]['max_pos']
-                        min_rot = bone_data[bone.name]['min_rot']
-                        max_rot = bone_data[bone.name]['max_rot']
-                        
-                        norm_pos = [
-                            2.0 * (loc.x - min_pos[0]) / (max_pos[0] - min_pos[0]) - 1.0,
-                            2.0 * (loc.y - min_pos[1]) / (max_pos[1] - min_pos[1]) - 1.0,
-                            2.0 * (loc.z - min_pos[2]) / (max_pos[2] - min_pos[2]) - 1.0
-                        ]
-                        
-                        norm_rot = [
-                            2.0 * (rot.x - min_rot[0]) / (max_rot[0] - min_rot[0]) - 1.0,
-                            2.0 * (rot.y - min_rot[1]) / (max_rot[1] - min_rot[1]) - 1.0,
-                            2.0 * (rot.z - min_rot[2]) / (max_rot[2] - min_rot[2]) - 1.0
-                        ]
-                        
-                        norm_pos = [max(-1.0, min(1.0, v)) for v in norm_pos]
-                        norm_rot = [max(-1.0, min(1.0, v)) for v in norm_rot]
-                        
-                        bone_values = {
-                            "position": {
-                                "x": round(norm_pos[0], self.precision),
-                                "y": round(norm_pos[1], self.precision),
-                                "z": round(norm_pos[2], self.precision)
-                            },
-                            "rotation": {
-                                "x": round(norm_rot[0], self.precision),
-                                "y": round(norm_rot[1], self.precision),
-                                "z": round(norm_rot[2], self.precision)
-                            }
-                        }
-                    
-                    if self.export_format == 'CSV':
-                        if len(bones_to_export) == 1:
-                            frame_data["pos_x"] = bone_values["position"]["x"]
-                            frame_data["pos_y"] = bone_values["position"]["y"]
-                            frame_data["pos_z"] = bone_values["position"]["z"]
-                            frame_data["rot_x"] = bone_values["rotation"]["x"]
-                            frame_data["rot_y"] = bone_values["rotation"]["y"]
-                            frame_data["rot_z"] = bone_values["rotation"]["z"]
+                    with ExitStack() as action_stack:
+                        if combined:
+                            def open_writer(frames, ranges, streaming, changed_rows=None):
+                                combined_writer.begin_action(action.name, frames, ranges)
+                                return combined_writer
                         else:
-                            frame_data[f"{bone.name}_pos_x"] = bone_values["position"]["x"]
-                            frame_data[f"{bone.name}_pos_y"] = bone_values["position"]["y"]
-                            frame_data[f"{bone.name}_pos_z"] = bone_values["position"]["z"]
-                            frame_data[f"{bone.name}_rot_x"] = bone_values["rotation"]["x"]
-                            frame_data[f"{bone.name}_rot_y"] = bone_values["rotation"]["y"]
-                            frame_data[f"{bone.name}_rot_z"] = bone_values["rotation"]["z"]
-                    
-                    frame_bones_data[bone.name] = bone_values
+                            action_path = action_paths[action_idx]
+                            
+                            def open_writer(frames, ranges, streaming, changed_rows=None):
+                                if changed_rows is not None:
+                                    patch_writer = self.open_patch_writer(action_path, action_stack, frames, bone_names, changed_rows)
+                                    if patch_writer:
+                                        return patch_writer
+                                
+                                # Line buffered when streaming so tail-following consumers see each frame right away
+                                outfile = action_stack.enter_context(self.open_output(action_path, line_buffered=streaming))
+                                return self.create_writer(outfile, bone_names, frames, ranges, action.name)
+                        
+                        writer = yield from scale_progress(
+                            self.export_action(context, [(obj, bones_to_export)], frames_to_sample, sample_interval, open_writer),
+                            action_idx / len(actions), 1.0 / len(actions)
+                        )
+                        if writer is None:
+                            break
+                        exported_count += 1
+                        if not combined:
+                            written.append(action_path)
+                            self.finish_writer(writer)
                 
-                if self.export_format == 'JSON':
-                    frames_data[str(frame)] = frame_bones_data
-                else:  
-                    animation_data.append(frame_data)
+                if combined and exported_count:
+                    self.finish_writer(combined_writer)
+            
+            if not exported_count:
+                return self.cancel_empty_export()
             
-            if self.export_format == 'CSV':
-                self.export_csv(filepath, animation_data)
-            elif self.export_format == 'JSON':
-                self.export_json(filepath, frames_data)
+            if len(written) == 1:
+                self.report({'INFO'}, f"Motion data exported to: {written[0]}")
+            else:
+                self.report({'INFO'}, f"Motion data of {len(actions)} actions exported to {len(written)} files in: {os.path.dirname(filepath)}")
+            self.report_profile(filepath, written)
+            
+            return {'FINISHED'}
             
-            self.report({'INFO'}, f"Motion data exported to: {filepath}")
+        except Exception as e:
+            self.report({'ERROR'}, f"Error writing file: {str(e)}")
             
+            return {'CANCELLED'}
+        
+        finally:
+            animation_data.action = original_action
+            animation_data.use_nla = original_use_nla
+            if created_animation_data:
+                obj.animation_data_clear()
             context.scene.frame_set(original_frame)
+    
+    def export_armatures(self, context, armatures, filepath):
+        """Export the active actions of several armatures, evaluating every frame once for all of them (export steps)"""
+        if self.action_source != 'ACTIVE':
+            self.report({'WARNING'}, "Several armatures are exported with their active actions only")
+        if self.watch_changes:
+            self.report({'WARNING'}, "Watching works on a single armature, not watching this export")
+        
+        rigs = []
+        for obj in armatures:
+            if not obj.animation_data or not obj.animation_data.action:
+                self.report({'WARNING'}, f"Skipping armature {obj.name}, no motion data found")
+                continue
+            
+            bones = self.select_bones(obj)
+            if not bones:
+                self.report({'WARNING'}, f"Skipping armature {obj.name}, no bones found to export")
+                continue
+            
+            rigs.append((obj, bones))
+        
+        if not rigs:
+            self.report({'ERROR'}, "No selected armature has motion data and bones to export")
+            return {'CANCELLED'}
+        
+        bone_slices = []
+        bone_start = 0
+        for obj, bones in rigs:
+            bone_slices.append(slice(bone_start, bone_start + len(bones)))
+            bone_start += len(bones)
+        
+        frames_to_sample, sample_interval = self.get_sample_frames([obj.animation_data.action for obj, bones in rigs])
+        original_frame = context.scene.frame_current
+        
+        try:
+            with ExitStack() as stack:
+                if self.isolate_evaluation:
+                    stack.enter_context(isolated_evaluation(context, [obj for obj, bones in rigs]))
+                if self.multi_armature_output == 'COMBINED':
+                    written = [filepath]
+                    bone_names = [f"{obj.name}/{bone.name}" for obj, bones in rigs for bone in bones]
+                    
+                    def open_writer(frames, ranges, streaming, changed_rows=None):
+                        outfile = stack.enter_context(self.open_output(filepath, line_buffered=streaming))
+                        return self.create_writer(outfile, bone_names, frames, ranges, context.scene.name)
+                else:
+                    written = self.get_suffixed_filepaths(filepath, [obj.name for obj, bones in rigs])
+                    
+                    def open_writer(frames, ranges, streaming, changed_rows=None):
+                        writers = []
+                        for (obj, bones), bone_slice, rig_path in zip(rigs, bone_slices, written):
+                            outfile = stack.enter_context(self.open_output(rig_path, line_buffered=streaming))
+                            rig_ranges = None if ranges is None else (ranges[0][bone_slice], ranges[1][bone_slice])
+                            writers.append(self.create_writer(
+                                outfile, [bone.name for bone in bones], frames, rig_ranges, obj.animation_data.action.name
+                            ))
+                        return MotionSplitWriter(writers, bone_slices)
+                
+                writer = yield from self.export_action(context, rigs, frames_to_sample, sample_interval, open_writer)
+                if writer is not None:
+                    self.finish_writer(writer)
+            
+            if writer is None:
+                return self.cancel_empty_export()
+            
+            if len(written) == 1:
+                self.report({'INFO'}, f"Motion data of {len(rigs)} armatures exported to: {written[0]}")
+            else:
+                self.report({'INFO'}, f"Motion data of {len(rigs)} armatures exported to {len(written)} files in: {os.path.dirname(filepath)}")
+            self.report_profile(filepath, written)
             
             return {'FINISHED'}
             
         except Exception as e:
             self.report({'ERROR'}, f"Error writing file: {str(e)}")
             
+            return {'CANCELLED'}
+        
+        finally:
             context.scene.frame_set(original_frame)
+    
+    def select_bones(self, obj):
+        """Pose bones of obj chosen by the bone selection, None if the chosen bone or collection doesn't exist on obj"""
+        pose_bones = obj.pose.bones
+        
+        if self.bone_selection == 'BONE' and self.bone_to_export != "ALL":
+            return [pose_bones[self.bone_to_export]] if self.bone_to_export in pose_bones else None
+        
+        # Resolved once against the hierarchy, only the matching bones are captured and written
+        hierarchy = BoneHierarchy(pose_bones)
+        if self.bone_selection == 'PATTERN':
+            bone_indices = hierarchy.match(self.bone_pattern, self.use_regex)
+        elif self.bone_selection == 'COLLECTION':
+            collection = next((collection for collection in get_bone_collections(obj) if collection.name == self.bone_collection), None)
+            if collection is None:
+                return None
+            bone_indices = hierarchy.find(get_bone_collection_bone_names(obj, collection))
+        elif self.bone_selection == 'SUBTREE' and self.bone_to_export != "ALL":
+            if self.bone_to_export not in pose_bones:
+                return None
+            bone_indices = hierarchy.subtree(self.bone_to_export)
+        else:
+            bone_indices = range(len(hierarchy.names))
+        
+        bones = list(pose_bones)
+        return [bones[bone_idx] for bone_idx in bone_indices if self.show_hidden_bones or not bones[bone_idx].bone.hide]
+    
+    def get_sample_frames(self, actions):
+        """Frames to sample (and their interval) covering the frame ranges of all actions"""
+        if self.use_custom_range:
+            start_frame = self.start_frame
+            end_frame = self.end_frame
+        else:
+            start_frame = min(int(action.frame_range[0]) for action in actions)
+            end_frame = max(int(action.frame_range[1]) for action in actions)
+        
+        if self.sample_all_frames or self.sampling_mode == 'ADAPTIVE':
+            # Adaptive sampling decimates afterwards, so it starts from every step
+            sample_interval = self.frame_step
+        else:
+            sample_interval = max(self.frame_step, (end_frame - start_frame) // 500)
+        
+        return range(start_frame, end_frame + 1, sample_interval), sample_interval
+    
+    def get_suffixed_filepath(self, filepath, suffix):
+        base = filepath[:-len(self.filename_ext)] if filepath.endswith(self.filename_ext) else filepath
+        return f"{base}_{bpy.path.clean_name(suffix)}{self.filename_ext}"
+    
+    def get_suffixed_filepaths(self, filepath, suffixes):
+        """One suffixed path per suffix, numbered where cleaned names collide (e.g. "Walk.001" and "Walk_001")"""
+        paths = []
+        for suffix in suffixes:
+            path = self.get_suffixed_filepath(filepath, suffix)
+            number = 1
+            while path in paths:
+                number += 1
+                path = self.get_suffixed_filepath(filepath, f"{suffix}_{number}")
+            paths.append(path)
+        return paths
+    
+    def export_action(self, context, rigs, frames_to_sample, sample_interval, open_writer):
+        """
+        Sample the assigned actions of rigs, a list of (armature, pose bones), and write them
+        through open_writer(frames, ranges, streaming, changed_rows). Bones of all rigs are
+        concatenated. Yields the progress like export_steps and returns the writer, not finished yet,
+        or None when cancelled before any frame was sampled (nothing is opened then).
+        """
+        watching = self.watch_changes and len(rigs) == 1 and self.action_source == 'ACTIVE'
+        adaptive = self.sampling_mode == 'ADAPTIVE'
+        profile = self._profile
+        
+        # Shards re-run the export on the active armature only
+        use_shards = self.shard_count > 1 and len(rigs) == 1
+        if self.shard_count > 1 and not use_shards:
+            self.report({'WARNING'}, "Parallel processes are not used when exporting several armatures")
+        if self.use_sample_cache and len(rigs) > 1:
+            self.report({'WARNING'}, "The sample cache is not used when exporting several armatures")
+        
+        use_scene = True
+        if self.evaluation_mode == 'FCURVE':
+            fallback_reason = next(filter(None, (get_fcurve_fallback_reason(obj) for obj, bones in rigs)), None)
+            if fallback_reason:
+                self.report({'WARNING'}, f"Direct F-curve evaluation unavailable ({fallback_reason}), using scene evaluation")
+            else:
+                use_scene = False
+        
+        # Quantization needs every channel's range before the first frame is written
+        # The sample cache is filled from the store
+        if (use_scene and not use_shards and not watching and not adaptive and not self.use_sample_cache
+                and self.coordinate_system == 'WORLD' and self.export_format != 'QUANTIZED'):
+            # Nothing depends on later frames, so rows go to disk as soon as they are sampled
+            started = time.perf_counter()
+            writer = open_writer(frames_to_sample, None, True)
+            if profile is not None:
+                profile.add("write", started)
             
-            return {'CANCELLED'}
+            for frame_idx, frame, frame_channels in iter_scene_channels(context, rigs, frames_to_sample, profile):
+                started = time.perf_counter()
+                writer.write_frame(frame, frame_channels)
+                if profile is not None:
+                    profile.add("write", started)
+                yield (frame_idx + 1) / len(frames_to_sample)
+                if self._cancel_requested:
+                    break
+            return writer
+        
+        # Evaluate each frame exactly once and keep every bone's transform,
+        # normalization ranges are derived from the store afterwards.
+        store = MotionSampleStore(frames_to_sample, [bone.name for obj, bones in rigs for bone in bones])
+        sample_store = store
+        changed_rows = None
+        
+        # A watch refresh starts from the previous samples and only resamples the frames the edit touched
+        watch = MOTION_WATCHES.get(rigs[0][0].name) if watching else None
+        if watch is not None and watch.dirty_window is not None and watch.matches(store):
+            changed_rows = watch.get_dirty_rows()
+            store.channels[:] = watch.store.channels
+            sample_store = MotionSampleStore(store.frames[changed_rows], store.bone_names)
+            use_shards = False
+        
+        cache_key = None
+        if self.use_sample_cache and len(rigs) == 1 and changed_rows is None:
+            cache_reason = get_sample_cache_fallback_reason(rigs[0][0])
+            if cache_reason:
+                self.report({'INFO'}, f"Sample cache not used ({cache_reason})")
+            else:
+                cache_key = get_sample_cache_key(rigs[0][0])
+        cached = cache_key is not None and load_cached_samples(cache_key, sample_store)
+        
+        # Sampling is the first half of the progress, writing the second
+        started = time.perf_counter()
+        if cached:
+            if profile is not None:
+                profile.add("evaluate", started, sample_store.frame_count)
+            self.report({'INFO'}, "Samples loaded from the sample cache, evaluation skipped")
+            yield 0.5
+        elif not sample_store.frame_count:
+            yield 0.5
+        elif not use_scene:
+            bone_offset = 0
+            for obj, bones in rigs:
+                evaluate_fcurve_channels(obj, bones, sample_store, bone_offset)
+                bone_offset += len(bones)
+            if profile is not None:
+                # Curve evaluation and matrix math run together per bone, not per frame
+                profile.add("evaluate", started, sample_store.frame_count)
+            yield 0.5
+        elif use_shards:
+            yield from scale_progress(self.capture_shards(rigs[0][0], sample_store, sample_interval), 0.0, 0.5)
+            if profile is not None:
+                # Waiting for the workers, including the time between modal slices
+                profile.add("evaluate", started, sample_store.frame_count)
+        else:
+            for frame_idx, frame, frame_channels in iter_scene_channels(context, rigs, sample_store.frames.tolist(), profile):
+                sample_store.channels[frame_idx] = frame_channels
+                yield 0.5 * (frame_idx + 1) / sample_store.frame_count
+                if self._cancel_requested:
+                    sample_store.truncate(frame_idx + 1)
+                    break
+        
+        if self._cancel_requested and not sample_store.frame_count:
+            # Cancelled before the first shard finished, there is nothing to write
+            return None
+        
+        if cache_key is not None and not cached and not self._cancel_requested:
+            try:
+                save_cached_samples(cache_key, sample_store)
+            except OSError as e:
+                self.report({'WARNING'}, f"Could not write the sample cache: {e}")
+        
+        started = time.perf_counter()
+        if changed_rows is not None:
+            store.channels[changed_rows] = sample_store.channels
+        if watching and not self._cancel_requested:
+            # A cancelled export holds only the leading frames, watching needs the whole take
+            self.watch_export(rigs[0][0], store)
+        
+        if self.coordinate_system == 'NORMALIZED':
+            store.normalize()
+        
+        ranges = None
+        if store.min_values is not None:
+            ranges = (store.min_values, store.max_values)
+        elif self.export_format == 'QUANTIZED':
+            ranges = get_normalization_ranges(store.channels)
+        
+        if adaptive and store.frame_count > 2:
+            keep = np.zeros(store.frame_count, dtype=bool)
+            if self.keep_keyframes:
+                keep = np.isin(store.frames, get_keyframe_frames([obj.animation_data.action for obj, bones in rigs]))
+            
+            sampled_count = store.frame_count
+            store.keep_rows(get_adaptive_rows(store.frames, store.channels, keep, self.adaptive_tolerance))
+            self.report({'INFO'}, f"Adaptive sampling kept {store.frame_count} of {sampled_count} frames")
+            # Rows moved, a watched file can't be patched in place
+            changed_rows = None
+        
+        if profile is not None:
+            profile.add("process", started)
+        
+        started = time.perf_counter()
+        writer = open_writer(store.frames, ranges, False, changed_rows)
+        if profile is not None:
+            profile.add("write", started)
+        
+        for frame_idx, (frame, frame_channels) in enumerate(zip(store.frames.tolist(), store.channels)):
+            started = time.perf_counter()
+            writer.write_frame(frame, frame_channels)
+            if profile is not None:
+                profile.add("write", started)
+            yield 0.5 + 0.5 * (frame_idx + 1) / store.frame_count
+        return writer
     
-    def export_csv(self, filepath, animation_data):
-        with open(filepath, 'w', newline='') as csvfile:
-            if animation_data:
-                fieldnames = animation_data[0].keys()
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(animation_data)
+    def watch_export(self, obj, store):
+        """Register (or renew) the watch of obj with a copy of the raw samples, before normalization"""
+        settings = self.as_keywords(ignore=("filter_glob",))
+        settings.update(use_progress=False, use_selected_armatures=False)
+        
+        raw_store = MotionSampleStore(store.frames, store.bone_names)
+        raw_store.channels[:] = store.channels
+        MOTION_WATCHES[obj.name] = MotionWatch(raw_store, snapshot_keyframes(obj.animation_data.action), settings)
     
-    def export_json(self, filepath, frames_data):
-        first_frame = next(iter(frames_data.values()))
-        bone_names = list(first_frame.keys())
+    def open_patch_writer(self, filepath, stack, frames, bone_names, changed_rows):
+        """Writer patching changed_rows of an existing world-space .npy / .bmotion export in place, None if it can't"""
+        if self.coordinate_system != 'WORLD' or self.export_format not in {'NPY', 'INDEXED'} or not os.path.exists(filepath):
+            return None
         
-        # Analyze bone hierarchy
-        obj = bpy.context.active_object
-        bone_groups = {}
+        outfile = stack.enter_context(open(filepath, 'r+b'))
+        data_offset = get_patch_data_offset(outfile, self.export_format, len(frames), len(bone_names))
+        if data_offset is None:
+            return None
+        if self._profile is not None:
+            # The .npz sidecar of a patched .npy stays as it is
+            self._profile.add_existing_output(filepath)
+            self._profile.add_existing_output(os.path.splitext(filepath)[0] + ".npz")
+        return MotionPatchWriter(outfile, self.export_format, len(frames), len(bone_names), data_offset, changed_rows)
+    
+    def finish_writer(self, writer):
+        started = time.perf_counter()
+        writer.finish()
+        if self._profile is not None:
+            self._profile.add("write", started)
+            if isinstance(writer, MotionPatchWriter):
+                self._profile.bytes_patched += writer.bytes_written
         
-        for bone_name in bone_names:
-            if bone_name in obj.pose.bones:
-                bone = obj.pose.bones[bone_name]
-                
-                # Try to determine bone type from name
-                bone_type = "other"
-                name_lower = bone_name.lower()
+        if self.export_format == 'QUANTIZED':
+            self.report({'INFO'}, f"Maximum quantization error: {writer.max_error:.3g}")
+    
+    def report_profile(self, filepath, written):
+        """Report the profile of a finished export and write its sidecar if asked for"""
+        if self._profile is None:
+            return
+        
+        if self.export_format == 'NPY':
+            # Frames, bone names and ranges go to the .npz sidecar of every .npy
+            written = written + [os.path.splitext(path)[0] + ".npz" for path in written]
+        summary = self._profile.get_summary(written)
+        self.report({'INFO'}, self._profile.get_report(summary))
+        if not self.write_profile:
+            return
+        
+        base = filepath[:-len(self.filename_ext)] if filepath.endswith(self.filename_ext) else filepath
+        profile_path = base + ".profile.json"
+        summary.update(
+            addon_version=".".join(str(part) for part in bl_info["version"]),
+            blender_version=bpy.app.version_string,
+            files=written,
+            settings=self.as_keywords(ignore=("filter_glob", "filepath")),
+            frame_time_histograms={phase: get_time_histogram(times) for phase, times in self._profile.frame_times.items()},
+        )
+        with open(profile_path, 'w') as profile_file:
+            json.dump(summary, profile_file, indent=2)
+        self.report({'INFO'}, f"Profile written to: {profile_path}")
+    
+    def get_shard_options(self, shard_path, shard, sample_interval):
+        """Operator options of the background export of one shard, frames as given (actions may start at 0 or below)"""
+        return dict(
+            filepath=shard_path,
+            export_format='NPY',
+            coordinate_system='WORLD',
+            evaluation_mode='SCENE',
+            bone_selection=self.bone_selection,
+            bone_to_export=self.bone_to_export,
+            bone_pattern=self.bone_pattern,
+            use_regex=self.use_regex,
+            bone_collection=self.bone_collection,
+            show_hidden_bones=self.show_hidden_bones,
+            use_custom_range=True,
+            start_frame=int(shard[0]),
+            end_frame=int(shard[-1]),
+            sample_all_frames=True,
+            frame_step=sample_interval,
+        )
+    
+    def capture_shards(self, obj, store, sample_interval):
+        """
+        Evaluate contiguous frame shards in background Blender processes and merge them in frame
+        order. Yields the share of finished shards while waiting for them. When cancelled, the
+        running workers are killed and the store keeps the leading shards that had finished.
+        """
+        shards = [shard for shard in np.array_split(store.frames, min(self.shard_count, store.frame_count)) if len(shard)]
+        threads = max(1, (os.cpu_count() or 1) // len(shards))
+        
+        with tempfile.TemporaryDirectory(prefix="bone_motion_shards_") as shard_dir:
+            # Workers load a copy of the current state, including unsaved edits
+            blend_path = os.path.join(shard_dir, "scene.blend")
+            bpy.ops.wm.save_as_mainfile(filepath=blend_path, copy=True)
+            
+            processes = []
+            for shard_idx, shard in enumerate(shards):
+                shard_path = os.path.join(shard_dir, f"shard_{shard_idx:03d}")
+                options = self.get_shard_options(shard_path, shard, sample_interval)
+                expression = (
+                    "import bpy\n"
+                    f"bpy.context.view_layer.objects.active = bpy.data.objects[{obj.name!r}]\n"
+                    f"if bpy.ops.export.bone_motion_data(**{options!r}) != {{'FINISHED'}}:\n"
+                    "    raise RuntimeError('shard export failed')\n"
+                )
+                command = [
+                    bpy.app.binary_path, "-b", "--factory-startup", blend_path,
+                    "--threads", str(threads), "--python-exit-code", "1",
+                    "--python", os.path.abspath(__file__),
+                    "--python-expr", expression,
+                ]
+                # Output goes to a log file, a pipe nobody reads while polling could fill up and stall the worker
+                with open(shard_path + ".log", 'w') as log:
+                    processes.append((shard_path, subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)))
+            
+            try:
+                while True:
+                    finished = sum(process.poll() is not None for shard_path, process in processes)
+                    yield finished / len(processes)
+                    if finished == len(processes) or self._cancel_requested:
+                        break
+                    time.sleep(SHARD_POLL_SECONDS)
+            finally:
+                # Cancelled or failed: don't leave workers running on a deleted temporary directory
+                for shard_path, process in processes:
+                    if process.poll() is None:
+                        process.kill()
+                        process.wait()
+            
+            if self._cancel_requested:
+                # Only the finished shards in front of the first killed one continue the frames from the start
+                finished_count = 0
+                while finished_count < len(processes) and processes[finished_count][1].returncode == 0:
+                    finished_count += 1
+                processes = processes[:finished_count]
+            
+            for shard_idx, (shard_path, process) in enumerate(processes):
+                if process.returncode != 0:
+                    with open(shard_path + ".log") as log:
+                        output = log.read()
+                    raise RuntimeError(f"Shard {shard_idx + 1} of {len(processes)} failed: {output.strip()[-500:]}")
+            
+            row = 0
+            for shard_path, process in processes:
+                channels = np.load(shard_path + ".npy")
+                sidecar = np.load(shard_path + ".npz")
                 
-                if "arm" in name_lower or "hand" in name_lower or "finger" in name_lower or "thumb" in name_lower:
-                    bone_type = "arm"
-                elif "leg" in name_lower or "foot" in name_lower or "toe" in name_lower:
-                    bone_type = "leg"
-                elif "spine" in name_lower or "neck" in name_lower:
-                    bone_type = "spine"
-                elif "head" in name_lower or "face" in name_lower or "jaw" in name_lower:
-                    bone_type = "head"
-                elif "hip" in name_lower or "pelvis" in name_lower:
-                    bone_type = "hip"
+                shard_frames = store.frames[row:row + len(channels)]
+                if list(sidecar["bone_names"]) != store.bone_names or not np.array_equal(sidecar["frames"], shard_frames):
+                    raise RuntimeError("Shard output does not match the requested frames or bones")
                 
-                if bone_type not in bone_groups:
-                    bone_groups[bone_type] = []
-                bone_groups[bone_type].append(bone_name)
-        
-        bones_data = {}
-        for bone_type, bones in bone_groups.items():
-            bones_data[bone_type] = {}
-            for bone_name in bones:
-                bones_data[bone_type][bone_name] = {
-                    "frames": {}
-                }
-                for frame, frame_data in frames_data.items():
-                    if bone_name in frame_data:
-                        bones_data[bone_type][bone_name]["frames"][frame] = frame_data[bone_name]
-        
-        organized_data = {
+                store.channels[row:row + len(channels)] = channels
+                row += len(channels)
+            
+            if self._cancel_requested:
+                store.truncate(row)
+            elif row != store.frame_count:
+                raise RuntimeError(f"Shards returned {row} of {store.frame_count} frames")
+    
+    def open_output(self, filepath, line_buffered=False):
+        if self.export_format == 'SQLITE':
+            # A library may hold earlier takes, an unfinished take is rolled back instead of deleted
+            if self._profile is not None:
+                self._profile.add_existing_output(filepath)
+            return closing(sqlite3.connect(filepath))
+        
+        self._output_paths.append(filepath)
+        if self.export_format in {'NPY', 'INDEXED', 'QUANTIZED'}:
+            return open(filepath, 'wb')
+        elif self.compression != 'NONE':
+            # Flushing every line would defeat the compressor, so compressed output is block buffered
+            return open_compressed_text(filepath, self.compression, self.compression_level)
+        return open(filepath, 'w', newline='', buffering=1 if line_buffered else -1)
+    
+    def create_writer(self, outfile, bone_names, frames, ranges=None, take_name=""):
+        if self.export_format == 'NPY':
+            return MotionNPYWriter(outfile, frames, bone_names, self.coordinate_system, ranges)
+        elif self.export_format == 'INDEXED':
+            return MotionIndexedWriter(outfile, bone_names, self.coordinate_system, ranges)
+        elif self.export_format == 'QUANTIZED':
+            return MotionQuantizedWriter(outfile, bone_names, self.coordinate_system, ranges)
+        elif self.export_format == 'SQLITE':
+            writer = MotionSQLiteWriter(outfile, bone_names, self.precision, self.coordinate_system)
+            writer.begin_action(take_name, frames, ranges)
+            return writer
+        elif self.export_format == 'CSV':
+            return MotionCSVWriter(outfile, bone_names, self.precision)
+        
+        header = {
+            "metadata": {
+                "format": "bone motion data by frame",
+                "coordinate_system": self.coordinate_system.lower(),
+                "frame_count": len(frames),
+                "bone_count": len(bone_names),
+                "frame_range": [int(frames[0]), int(frames[-1])]
+            }
+        }
+        if self.include_bone_index:
+            header["by_bone_type"] = get_bone_type_index(bone_names)
+        
+        if self.export_format == 'NDJSON':
+            return MotionNDJSONWriter(outfile, bone_names, self.precision, header)
+        return MotionJSONWriter(outfile, bone_names, self.precision, header)
+    
+    def create_combined_writer(self, outfile, bone_names, action_names):
+        if self.export_format == 'SQLITE':
+            return MotionSQLiteWriter(outfile, bone_names, self.precision, self.coordinate_system)
+        elif self.export_format == 'CSV':
+            return MotionCSVWriter(outfile, bone_names, self.precision, action_column=True)
+        
+        header = {
             "metadata": {
-                "format": "bone motion data in by frame and by bone type",
+                "format": "bone motion data by action and frame",
                 "coordinate_system": self.coordinate_system.lower(),
-                "frame_count": len(frames_data),
                 "bone_count": len(bone_names),
-                "frame_range": [int(min(frames_data.keys())), int(max(frames_data.keys()))]
-            },
-            "by_frame": frames_data,
-            "by_bone_type": bones_data
+                "actions": action_names
+            }
         }
+        if self.include_bone_index:
+            header["by_bone_type"] = get_bone_type_index(bone_names)
+        
+        if self.export_format == 'NDJSON':
+            return MotionNDJSONWriter(outfile, bone_names, self.precision, header)
+        return MotionJSONWriter(outfile, bone_names, self.precision, header, combined=True)
+
+class BONE_OT_stop_motion_watch(Operator):
+    bl_idname = "export.bone_motion_watch_stop"
+    bl_label = "Stop Watching Bone Motion"
+    bl_description = "Stop re-exporting watched armatures when their actions change"
+    
+    @classmethod
+    def poll(cls, context):
+        return bool(MOTION_WATCHES)
+    
+    def execute(self, context):
+        watched = ", ".join(MOTION_WATCHES)
+        MOTION_WATCHES.clear()
+        self.report({'INFO'}, f"Stopped watching: {watched}")
+        return {'FINISHED'}
+
+def capture_action_ranges(context, obj, bones):
+    """Normalization ranges over one capture pass of obj's action, None without an action"""
+    if not obj.animation_data or not obj.animation_data.action:
+        return None
+    
+    frame_range = obj.animation_data.action.frame_range
+    store = MotionSampleStore(range(int(frame_range[0]), int(frame_range[1]) + 1), [bone.name for bone in bones])
+    original_frame = context.scene.frame_current
+    try:
+        for frame_idx, frame, frame_channels in iter_scene_channels(context, [(obj, bones)], store.frames.tolist()):
+            store.channels[frame_idx] = frame_channels
+    finally:
+        context.scene.frame_set(original_frame)
+    
+    return get_normalization_ranges(store.channels)
+
+class MotionLiveStreamHelper:
+    """
+    Bone selection, coordinate system and start/stop toggle shared by the live stream operators.
+    Subclasses set stream_kind and stream_label and implement create_stream_writer.
+    """
+    
+    stream_kind = ''
+    stream_label = ''
+    
+    show_hidden_bones: BoolProperty(
+        name="Show Hidden Bones",
+        description="Include bones that are hidden in the viewport",
+        default=False
+    )
+    
+    bone_to_export: EnumProperty(
+        name="Select Bone",
+        description="Choose which bone's motion to stream",
+        items=get_bones_callback
+    )
+    
+    coordinate_system: EnumProperty(
+        name="Coordinate System",
+        description="Choose the coordinate system for streaming",
+        items=COORDINATE_SYSTEM_ITEMS,
+        default='NORMALIZED'
+    )
+    
+    def invoke(self, context, event):
+        if self.stream_kind in LIVE_STREAMS:
+            return self.execute(context)
+        return context.window_manager.invoke_props_dialog(self)
+    
+    def execute(self, context):
+        if stop_live_stream(self.stream_kind):
+            self.report({'INFO'}, f"{self.stream_label} stopped")
+            return {'FINISHED'}
+        
+        obj = context.active_object
+        if not obj or obj.type != 'ARMATURE':
+            self.report({'ERROR'}, "Active object must be an armature")
+            return {'CANCELLED'}
+        
+        if self.bone_to_export == "ALL":
+            bones = [bone for bone in obj.pose.bones if self.show_hidden_bones or not bone.bone.hide]
+        elif self.bone_to_export in obj.pose.bones:
+            bones = [obj.pose.bones[self.bone_to_export]]
+        else:
+            self.report({'ERROR'}, f"Selected bone '{self.bone_to_export}' not found")
+            return {'CANCELLED'}
         
-        with open(filepath, 'w') as jsonfile:
-            json.dump(organized_data, jsonfile, indent=2)
+        if not bones:
+            self.report({'ERROR'}, "No bones found to stream")
+            return {'CANCELLED'}
+        
+        ranges = None
+        if self.coordinate_system == 'NORMALIZED':
+            ranges = capture_action_ranges(context, obj, bones)
+            if ranges is None:
+                self.report({'ERROR'}, f"Normalized streaming needs an action on {obj.name} to measure ranges")
+                return {'CANCELLED'}
+        
+        try:
+            writer = self.create_stream_writer([bone.name for bone in bones], ranges)
+        except (OSError, ImportError) as e:
+            self.report({'ERROR'}, f"Can't start {self.stream_label}: {e}")
+            return {'CANCELLED'}
+        
+        stream = MotionLiveStream(obj, bones, writer, ranges)
+        LIVE_STREAMS[self.stream_kind] = stream
+        stream.send(context.scene.frame_current)
+        
+        self.report({'INFO'}, f"Streaming {len(bones)} bones of {obj.name} to {self.get_stream_target()}")
+        return {'FINISHED'}
+
+class BONE_OT_stream_motion_osc(MotionLiveStreamHelper, Operator):
+    bl_idname = "export.bone_motion_osc_stream"
+    bl_label = "Stream Bone Motion (OSC)"
+    bl_description = "Start or stop sending the active armature's bone motion over OSC/UDP on every frame change"
+    
+    stream_kind = 'OSC'
+    stream_label = "OSC stream"
+    
+    host: StringProperty(
+        name="Host",
+        description="Host name or IP address of the OSC receiver",
+        default="127.0.0.1"
+    )
+    
+    port: IntProperty(
+        name="Port",
+        description="UDP port of the OSC receiver",
+        default=9000,
+        min=1,
+        max=65535
+    )
+    
+    address_prefix: StringProperty(
+        name="Address Prefix",
+        description="OSC address prefix, messages go to <prefix>/frame and <prefix>/<bone>",
+        default="/bone"
+    )
+    
+    use_bundles: BoolProperty(
+        name="Bundle per Frame",
+        description="Send each frame as OSC bundles instead of one datagram per message",
+        default=True
+    )
+    
+    def create_stream_writer(self, bone_names, ranges):
+        # Fail now on a bad host rather than silently on every frame
+        socket.getaddrinfo(self.host, self.port, socket.AF_INET, socket.SOCK_DGRAM)
+        return MotionOSCWriter(self.host, self.port, self.address_prefix, bone_names, self.use_bundles)
+    
+    def get_stream_target(self):
+        return f"{self.host}:{self.port}"
+
+class BONE_OT_stream_motion_shared_memory(MotionLiveStreamHelper, Operator):
+    bl_idname = "export.bone_motion_shared_memory_stream"
+    bl_label = "Stream Bone Motion (Shared Memory)"
+    bl_description = "Start or stop writing the active armature's bone motion into a shared memory ring buffer on every frame change"
+    
+    stream_kind = 'SHARED_MEMORY'
+    stream_label = "Shared memory stream"
+    
+    block_name: StringProperty(
+        name="Block Name",
+        description="Name of the shared memory block, readers attach with bone_motion_live.py",
+        default="bone_motion"
+    )
+    
+    slot_count: IntProperty(
+        name="Ring Slots",
+        description="Frames kept in the ring buffer before the oldest is overwritten",
+        default=64,
+        min=2,
+        max=4096
+    )
+    
+    def create_stream_writer(self, bone_names, ranges):
+        return MotionSharedMemoryWriter(self.block_name, bone_names, self.coordinate_system, self.slot_count, ranges)
+    
+    def get_stream_target(self):
+        return f"shared memory '{self.block_name}'"
 
 def menu_func_export(self, context):
     self.layout.operator(BONE_OT_export_motion_data.bl_idname, text="Bone Motion Data")
+    if MOTION_WATCHES:
+        self.layout.operator(BONE_OT_stop_motion_watch.bl_idname, text="Stop Watching Bone Motion")
+    self.layout.operator(
+        BONE_OT_stream_motion_osc.bl_idname,
+        text="Stop Bone Motion OSC Stream" if 'OSC' in LIVE_STREAMS else "Bone Motion OSC Stream"
+    )
+    self.layout.operator(
+        BONE_OT_stream_motion_shared_memory.bl_idname,
+        text="Stop Bone Motion Shared Memory" if 'SHARED_MEMORY' in LIVE_STREAMS else "Bone Motion Shared Memory"
+    )
 
 classes = (
     BONE_OT_export_motion_data,
+    BONE_OT_stop_motion_watch,
+    BONE_OT_stream_motion_osc,
+    BONE_OT_stream_motion_shared_memory,
 )
 
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
+    bpy.app.handlers.depsgraph_update_post.append(bone_enum_depsgraph_update)
+    bpy.app.handlers.depsgraph_update_post.append(motion_watch_depsgraph_update)
+    bpy.app.handlers.frame_change_post.append(live_stream_frame_change)
+    bpy.app.handlers.load_post.append(motion_load_post)
 
 def unregister():
+    motion_load_post()
+    bpy.app.handlers.depsgraph_update_post.remove(bone_enum_depsgraph_update)
+    bpy.app.handlers.depsgraph_update_post.remove(motion_watch_depsgraph_update)
+    bpy.app.handlers.frame_change_post.remove(live_stream_frame_change)
+    bpy.app.handlers.load_post.remove(motion_load_post)
     for cls in classes:
         bpy.utils.unregister_class(cls)
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
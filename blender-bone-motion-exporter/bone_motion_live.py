@@ -0,0 +1,171 @@
+# ❦ ˚`✵ electro-cute-angels ✵´˚ ❦
+"""
+Reader for the shared memory ring buffer written by the Bone Motion Data Exporter's
+"Bone Motion Shared Memory" live output. Pure Python 3.8+, no Blender or NumPy needed.
+
+Attaching maps the block into this process, latest() then reads the newest frame straight
+out of shared memory: no socket, no copy of the ring and no serialization. Columns follow the
+CSV export ("frame", "<bone>_pos_x", ...), values are in the units of the stream.
+
+    from bone_motion_live import LiveMotionReader
+
+    with LiveMotionReader("bone_motion") as live:
+        sequence = 0
+        while True:
+            sequence = live.wait(sequence, timeout=1.0)
+            latest = live.latest()
+            if latest:
+                sequence, frame, values = latest
+                print(frame, values[live.bone_names.index("LeftHand")])
+"""
+
+import struct
+import time
+from multiprocessing import shared_memory
+
+# Shared memory ring buffer layout, keep in sync with bone_motion_exporter.py
+LIVE_MAGIC = b"BMLIVE01"
+LIVE_VERSION = 1
+LIVE_FLAG_NORMALIZED = 1
+LIVE_FLAG_RANGES = 2
+LIVE_HEADER = struct.Struct("<8sHHIIIIII")
+LIVE_SEQUENCE_OFFSET = 40
+LIVE_NAMES_OFFSET = 48
+LIVE_SLOT_VALUES_OFFSET = 16
+
+CHANNEL_NAMES = ("pos_x", "pos_y", "pos_z", "rot_x", "rot_y", "rot_z")
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 every attach is tracked, and the tracker would unlink the
+        # exporter's block when this process exits
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(block._name, "shared_memory")
+        except (ImportError, AttributeError):
+            pass
+        return block
+
+class LiveMotionReader:
+    """Attached view of a live bone motion ring buffer"""
+
+    def __init__(self, name):
+        self._block = _attach(name)
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_header(self):
+        buffer = self._block.buf
+        if len(buffer) < LIVE_NAMES_OFFSET:
+            raise ValueError("Shared memory block is too small to be a live bone motion buffer")
+
+        magic, version, flags, bone_count, channel_count, slot_count, slot_size, slots_offset, names_size = LIVE_HEADER.unpack_from(buffer, 0)
+        if magic != LIVE_MAGIC:
+            raise ValueError("Not a live bone motion buffer (missing magic)")
+        if version != LIVE_VERSION:
+            raise ValueError(f"Unsupported live bone motion version {version}")
+
+        self.normalized = bool(flags & LIVE_FLAG_NORMALIZED)
+        self.coordinate_system = "normalized" if self.normalized else "world"
+        self.channel_names = CHANNEL_NAMES[:channel_count]
+        lines = bytes(buffer[LIVE_NAMES_OFFSET:LIVE_NAMES_OFFSET + names_size]).decode("utf-8").split("\n")
+        self.column_names = lines[0].split(",")
+        self.bone_names = lines[1:1 + bone_count]
+
+        self._bone_count = bone_count
+        self._channel_count = channel_count
+        self._slot_count = slot_count
+        self._slot_size = slot_size
+        self._slots_offset = slots_offset
+
+        self.min_values = None
+        self.max_values = None
+        if flags & LIVE_FLAG_RANGES:
+            value_count = bone_count * channel_count
+            offset = LIVE_NAMES_OFFSET + names_size + (-names_size % 8)
+            flat_min = struct.unpack_from(f"<{value_count}f", buffer, offset)
+            flat_max = struct.unpack_from(f"<{value_count}f", buffer, offset + 4 * value_count)
+            self.min_values = {bone_name: flat_min[i * channel_count:(i + 1) * channel_count] for i, bone_name in enumerate(self.bone_names)}
+            self.max_values = {bone_name: flat_max[i * channel_count:(i + 1) * channel_count] for i, bone_name in enumerate(self.bone_names)}
+
+        # Zero-copy typed views: the published sequence, and every slot's sequence, frame and values
+        self._sequence = buffer[LIVE_SEQUENCE_OFFSET:LIVE_SEQUENCE_OFFSET + 8].cast("Q")
+        self._slots = []
+        for slot_idx in range(slot_count):
+            start = slots_offset + slot_idx * slot_size
+            self._slots.append((
+                buffer[start:start + 8].cast("Q"),
+                buffer[start + 8:start + 12].cast("i"),
+                buffer[start + LIVE_SLOT_VALUES_OFFSET:start + LIVE_SLOT_VALUES_OFFSET + 4 * bone_count * channel_count].cast("f"),
+            ))
+
+    def close(self):
+        if getattr(self, "_block", None) is None:
+            return
+        # Exported views keep the mapping alive, release them before closing it
+        for views in getattr(self, "_slots", ()):
+            for view in views:
+                view.release()
+        if getattr(self, "_sequence", None) is not None:
+            self._sequence.release()
+        self._slots = []
+        self._sequence = None
+        self._block.close()
+        self._block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def sequence(self):
+        """Number of frames written so far, 0 before the first one"""
+        return self._sequence[0]
+
+    def latest(self, retries=8):
+        """
+        The newest frame, or None if nothing was written yet
+
+        Returns:
+            (sequence, frame, values) with values a list of per-bone channel lists
+        """
+        for _ in range(retries):
+            sequence = self._sequence[0]
+            if sequence == 0:
+                return None
+
+            slot_sequence, slot_frame, slot_values = self._slots[(sequence - 1) % self._slot_count]
+            frame = slot_frame[0]
+            flat = slot_values.tolist()
+
+            # The writer zeroes the slot sequence while rewriting it, a mismatch means a torn read
+            if slot_sequence[0] == sequence:
+                size = self._channel_count
+                return sequence, frame, [flat[i:i + size] for i in range(0, len(flat), size)]
+
+        return None
+
+    def values_view(self, sequence):
+        """Flat float view of the slot holding sequence, valid while is_current(sequence) holds"""
+        return self._slots[(sequence - 1) % self._slot_count][2]
+
+    def is_current(self, sequence):
+        """True while the slot of sequence hasn't been overwritten by a newer frame"""
+        return self._slots[(sequence - 1) % self._slot_count][0][0] == sequence
+
+    def wait(self, after, timeout=None, interval=0.001):
+        """Poll until a frame newer than sequence after is published, returns the current sequence"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            sequence = self._sequence[0]
+            if sequence > after or (deadline is not None and time.monotonic() >= deadline):
+                return sequence
+            time.sleep(interval)
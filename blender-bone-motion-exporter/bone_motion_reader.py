@@ -0,0 +1,255 @@
+# ❦ ˚`✵ electro-cute-angels ✵´˚ ❦
+"""
+Lazy random-access reader for the indexed binary (.bmotion) files written by the
+Bone Motion Data Exporter. Pure Python, no Blender or NumPy needed.
+
+Only the header and the footer index are parsed on open, motion data is memory-mapped
+and decoded on demand, so a single bone or a frame window of a long take can be read
+without touching the rest of the file. Quantized (.bmq) files are decoded with read_quantized.
+
+    from bone_motion_reader import MotionReader, read_quantized
+
+    with MotionReader("take.bmotion") as motion:
+        hand_x = motion.channel("LeftHand", "pos_x")
+        hand = motion.bone("LeftHand", 1000, 1100)
+        frames, window = motion.frame_range(1000, 1100)
+
+    motion = read_quantized("take.bmq")
+"""
+
+import bisect
+import mmap
+import struct
+
+# Indexed binary layout, keep in sync with bone_motion_exporter.py
+INDEXED_MAGIC = b"BMOTION1"
+INDEXED_END_MAGIC = b"BMINDEX1"
+INDEXED_VERSION = 1
+INDEXED_FLAG_NORMALIZED = 1
+INDEXED_HEADER = struct.Struct("<8sHHIII")
+INDEXED_TRAILER = struct.Struct("<QQ8s")
+
+# Quantized layout, keep in sync with bone_motion_exporter.py
+QUANTIZED_MAGIC = b"BMQUANT1"
+QUANTIZED_VERSION = 1
+QUANTIZED_FLAG_NORMALIZED = 1
+QUANTIZED_HEADER = struct.Struct("<8sHHIII")
+
+CHANNEL_NAMES = ("pos_x", "pos_y", "pos_z", "rot_x", "rot_y", "rot_z")
+
+class MotionReader:
+    """Memory-mapped view of a .bmotion file"""
+
+    def __init__(self, filepath):
+        self._file = open(filepath, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_index(self):
+        data = self._mmap
+        if len(data) < INDEXED_HEADER.size + INDEXED_TRAILER.size:
+            raise ValueError("File is too small to be a bone motion container")
+
+        magic, version, flags, bone_count, channel_count, chunk_frames = INDEXED_HEADER.unpack_from(data, 0)
+        footer_offset, footer_size, end_magic = INDEXED_TRAILER.unpack_from(data, len(data) - INDEXED_TRAILER.size)
+        if magic != INDEXED_MAGIC or end_magic != INDEXED_END_MAGIC:
+            raise ValueError("Not a bone motion container (missing magic)")
+        if version != INDEXED_VERSION:
+            raise ValueError(f"Unsupported bone motion container version {version}")
+
+        self.normalized = bool(flags & INDEXED_FLAG_NORMALIZED)
+        self.coordinate_system = "normalized" if self.normalized else "world"
+        self.channel_names = CHANNEL_NAMES[:channel_count]
+        self._channel_count = channel_count
+        self._chunk_frames = chunk_frames
+
+        offset = footer_offset
+        frame_count, chunk_count = struct.unpack_from("<II", data, offset)
+        offset += 8
+
+        self.frames = struct.unpack_from(f"<{frame_count}i", data, offset)
+        offset += 4 * frame_count
+        self._chunk_offsets = struct.unpack_from(f"<{chunk_count}Q", data, offset)
+        offset += 8 * chunk_count
+        self._bone_offsets = struct.unpack_from(f"<{chunk_count * bone_count}Q", data, offset)
+        offset += 8 * chunk_count * bone_count
+
+        self.bone_names = []
+        for _ in range(bone_count):
+            (length,) = struct.unpack_from("<H", data, offset)
+            offset += 2
+            self.bone_names.append(bytes(data[offset:offset + length]).decode("utf-8"))
+            offset += length
+        self._bone_indices = {bone_name: bone_idx for bone_idx, bone_name in enumerate(self.bone_names)}
+
+        self.min_values = None
+        self.max_values = None
+        if data[offset]:
+            offset += 1
+            value_count = bone_count * channel_count
+            flat_min = struct.unpack_from(f"<{value_count}f", data, offset)
+            flat_max = struct.unpack_from(f"<{value_count}f", data, offset + 4 * value_count)
+            self.min_values = {bone_name: flat_min[i * channel_count:(i + 1) * channel_count] for i, bone_name in enumerate(self.bone_names)}
+            self.max_values = {bone_name: flat_max[i * channel_count:(i + 1) * channel_count] for i, bone_name in enumerate(self.bone_names)}
+
+    def close(self):
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def frame_count(self):
+        return len(self.frames)
+
+    def _row_range(self, start_frame, end_frame):
+        """Row indices [start, stop) of the frames within start_frame..end_frame (inclusive)"""
+        start = 0 if start_frame is None else bisect.bisect_left(self.frames, start_frame)
+        stop = len(self.frames) if end_frame is None else bisect.bisect_right(self.frames, end_frame)
+        return start, max(start, stop)
+
+    def _bone_rows(self, bone_idx, start, stop):
+        """Flat channel values of one bone for rows [start, stop), reading only the chunks involved"""
+        values = []
+        if stop <= start:
+            return values
+
+        bone_count = len(self.bone_names)
+        for chunk_idx in range(start // self._chunk_frames, (stop - 1) // self._chunk_frames + 1):
+            chunk_start = chunk_idx * self._chunk_frames
+            first = max(start, chunk_start) - chunk_start
+            last = min(stop, chunk_start + self._chunk_frames) - chunk_start
+
+            offset = self._bone_offsets[chunk_idx * bone_count + bone_idx] + first * self._channel_count * 4
+            count = (last - first) * self._channel_count
+            values.extend(struct.unpack_from(f"<{count}f", self._mmap, offset))
+
+        return values
+
+    def _bone_index(self, bone_name):
+        if bone_name not in self._bone_indices:
+            raise KeyError(f"Bone '{bone_name}' not found in motion file")
+        return self._bone_indices[bone_name]
+
+    def bone(self, bone_name, start_frame=None, end_frame=None):
+        """List of (pos_x, pos_y, pos_z, rot_x, rot_y, rot_z) tuples for one bone, frames inclusive"""
+        start, stop = self._row_range(start_frame, end_frame)
+        values = self._bone_rows(self._bone_index(bone_name), start, stop)
+        size = self._channel_count
+        return [tuple(values[i:i + size]) for i in range(0, len(values), size)]
+
+    def channel(self, bone_name, channel, start_frame=None, end_frame=None):
+        """List of values of a single channel (e.g. "pos_x") of one bone, frames inclusive"""
+        if channel not in self.channel_names:
+            raise KeyError(f"Unknown channel '{channel}', expected one of {', '.join(self.channel_names)}")
+
+        start, stop = self._row_range(start_frame, end_frame)
+        values = self._bone_rows(self._bone_index(bone_name), start, stop)
+        return values[self.channel_names.index(channel)::self._channel_count]
+
+    def frame_range(self, start_frame, end_frame):
+        """
+        All bones for the frames within start_frame..end_frame (inclusive)
+
+        Returns:
+            (frames, {bone_name: [channel tuples]})
+        """
+        start, stop = self._row_range(start_frame, end_frame)
+        size = self._channel_count
+
+        bones = {}
+        for bone_idx, bone_name in enumerate(self.bone_names):
+            values = self._bone_rows(bone_idx, start, stop)
+            bones[bone_name] = [tuple(values[i:i + size]) for i in range(0, len(values), size)]
+
+        return list(self.frames[start:stop]), bones
+
+
+def _read_varint(data, offset):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+def _unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+def read_quantized(filepath):
+    """
+    Decode a quantized (.bmq) file back into motion values
+
+    Values come back in the units of the export: [-1, 1] for normalized exports (min_values /
+    max_values map them back to world space), world units otherwise.
+
+    Returns:
+        dict with frames, bone_names, channel_names, coordinate_system, min_values, max_values
+        and values, a list holding one [bone][channel] list per frame
+    """
+    with open(filepath, 'rb') as motion_file:
+        data = motion_file.read()
+
+    magic, version, flags, bone_count, channel_count, scale = QUANTIZED_HEADER.unpack_from(data, 0)
+    if magic != QUANTIZED_MAGIC:
+        raise ValueError("Not a quantized bone motion file (missing magic)")
+    if version != QUANTIZED_VERSION:
+        raise ValueError(f"Unsupported quantized bone motion version {version}")
+
+    offset = QUANTIZED_HEADER.size
+    bone_names = []
+    for _ in range(bone_count):
+        (length,) = struct.unpack_from("<H", data, offset)
+        offset += 2
+        bone_names.append(data[offset:offset + length].decode("utf-8"))
+        offset += length
+
+    value_count = bone_count * channel_count
+    min_values = struct.unpack_from(f"<{value_count}f", data, offset)
+    max_values = struct.unpack_from(f"<{value_count}f", data, offset + 4 * value_count)
+    offset += 8 * value_count
+
+    normalized = bool(flags & QUANTIZED_FLAG_NORMALIZED)
+    frames = []
+    values = []
+    frame = 0
+    quantized = [0] * value_count
+
+    while offset < len(data):
+        delta, offset = _read_varint(data, offset)
+        frame += _unzigzag(delta)
+        frames.append(frame)
+
+        frame_values = []
+        for i in range(value_count):
+            delta, offset = _read_varint(data, offset)
+            quantized[i] += _unzigzag(delta)
+            value = quantized[i] / scale
+            if not normalized:
+                value = min_values[i] + (value + 1.0) * 0.5 * (max_values[i] - min_values[i])
+            frame_values.append(value)
+
+        values.append([frame_values[i:i + channel_count] for i in range(0, value_count, channel_count)])
+
+    return {
+        "frames": frames,
+        "bone_names": bone_names,
+        "channel_names": CHANNEL_NAMES[:channel_count],
+        "coordinate_system": "normalized" if normalized else "world",
+        "min_values": {bone_name: min_values[i * channel_count:(i + 1) * channel_count] for i, bone_name in enumerate(bone_names)},
+        "max_values": {bone_name: max_values[i * channel_count:(i + 1) * channel_count] for i, bone_name in enumerate(bone_names)},
+        "values": values,
+    }
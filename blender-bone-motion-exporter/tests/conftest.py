@@ -0,0 +1,47 @@
+"""
+Writer -> reader round trips of the binary layouts. The writers live in the add-on module,
+which needs Blender, so outside of Blender the few bpy names it imports are stubbed.
+"""
+
+import os
+import sys
+import types
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    # The add-on needs NumPy, without it there is nothing to test
+    collect_ignore_glob = ["test_*.py"]
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import bpy  # noqa: F401
+except ImportError:
+    def _property(*args, **kwargs):
+        # Keeps the settings like Blender's deferred properties do
+        return types.SimpleNamespace(keywords=kwargs)
+
+    bpy = types.ModuleType("bpy")
+    bpy.props = types.ModuleType("bpy.props")
+    bpy.types = types.ModuleType("bpy.types")
+    bpy.app = types.SimpleNamespace(
+        handlers=types.SimpleNamespace(persistent=lambda function: function),
+        version_string="stub",
+    )
+    for name in ("StringProperty", "EnumProperty", "BoolProperty", "IntProperty", "FloatProperty"):
+        setattr(bpy.props, name, _property)
+    bpy.types.Operator = type("Operator", (), {})
+    bpy.types.Panel = type("Panel", (), {})
+
+    bpy_extras = types.ModuleType("bpy_extras")
+    bpy_extras.io_utils = types.ModuleType("bpy_extras.io_utils")
+    bpy_extras.io_utils.ExportHelper = type("ExportHelper", (), {})
+
+    sys.modules.update({
+        "bpy": bpy,
+        "bpy.props": bpy.props,
+        "bpy.types": bpy.types,
+        "bpy_extras": bpy_extras,
+        "bpy_extras.io_utils": bpy_extras.io_utils,
+    })
@@ -0,0 +1,71 @@
+import numpy as np
+
+from bone_motion_exporter import MotionIndexedWriter, MotionPatchWriter, get_patch_data_offset
+from bone_motion_reader import MotionReader
+
+BONE_NAMES = ["Hips", "Spine", "LeftHand"]
+
+def write_indexed(filepath, frames, values, coordinate_system='WORLD', ranges=None):
+    with open(filepath, 'wb') as outfile:
+        writer = MotionIndexedWriter(outfile, BONE_NAMES, coordinate_system, ranges)
+        for frame, frame_values in zip(frames, values):
+            writer.write_frame(frame, frame_values)
+        writer.finish()
+
+def make_values(frame_count):
+    rng = np.random.default_rng(8)
+    return rng.uniform(-5.0, 5.0, (frame_count, len(BONE_NAMES), 6)).astype(np.float32)
+
+def test_round_trip_across_chunks(tmp_path):
+    # More frames than a chunk holds, so the last chunk is a short one
+    frames = list(range(10, 10 + MotionIndexedWriter.CHUNK_FRAMES + 44))
+    values = make_values(len(frames))
+    filepath = tmp_path / "take.bmotion"
+    write_indexed(filepath, frames, values)
+
+    with MotionReader(filepath) as motion:
+        assert list(motion.frames) == frames
+        assert motion.bone_names == BONE_NAMES
+        assert motion.coordinate_system == "world"
+        assert motion.min_values is None
+        np.testing.assert_array_equal(motion.bone("Spine"), values[:, 1])
+        np.testing.assert_array_equal(motion.channel("LeftHand", "rot_y"), values[:, 2, 4])
+
+        # A window across the chunk boundary
+        window_frames, window = motion.frame_range(250, 280)
+        assert window_frames == list(range(250, 281))
+        np.testing.assert_array_equal(window["Hips"], values[240:271, 0])
+
+def test_normalized_ranges(tmp_path):
+    frames = [1, 2, 3]
+    values = make_values(len(frames)).clip(-1.0, 1.0)
+    ranges = (np.full((3, 6), -2.0, dtype=np.float32), np.full((3, 6), 4.0, dtype=np.float32))
+    filepath = tmp_path / "take.bmotion"
+    write_indexed(filepath, frames, values, 'NORMALIZED', ranges)
+
+    with MotionReader(filepath) as motion:
+        assert motion.coordinate_system == "normalized"
+        assert motion.min_values["LeftHand"] == (-2.0,) * 6
+        assert motion.max_values["Hips"] == (4.0,) * 6
+        np.testing.assert_array_equal(motion.bone("Hips", 2, 3), values[1:, 0])
+
+def test_patch_in_place(tmp_path):
+    frames = list(range(MotionIndexedWriter.CHUNK_FRAMES + 10))
+    values = make_values(len(frames))
+    filepath = tmp_path / "take.bmotion"
+    write_indexed(filepath, frames, values)
+
+    changed_rows = np.array([3, MotionIndexedWriter.CHUNK_FRAMES + 5])
+    patched = values.copy()
+    patched[changed_rows] += 1.0
+    with open(filepath, 'r+b') as motion_file:
+        data_offset = get_patch_data_offset(motion_file, 'INDEXED', len(frames), len(BONE_NAMES))
+        assert data_offset is not None
+        writer = MotionPatchWriter(motion_file, 'INDEXED', len(frames), len(BONE_NAMES), data_offset, changed_rows)
+        for frame, frame_values in zip(frames, patched):
+            writer.write_frame(frame, frame_values)
+        writer.finish()
+
+    with MotionReader(filepath) as motion:
+        for bone_idx, bone_name in enumerate(BONE_NAMES):
+            np.testing.assert_array_equal(motion.bone(bone_name), patched[:, bone_idx])
@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from bone_motion_exporter import MotionSharedMemoryWriter, column_names_for
+
+BONE_NAMES = ["Hips", "Left Hand"]
+
+# The reader runs in its own process like a real consumer, attaching from the exporter's
+# process would also unregister the block from this process's resource tracker
+READER_SCRIPT = """
+import json, sys
+from bone_motion_live import LiveMotionReader
+with LiveMotionReader(sys.argv[1]) as live:
+    print(json.dumps({
+        "bone_names": live.bone_names,
+        "column_names": live.column_names,
+        "coordinate_system": live.coordinate_system,
+        "min_values": live.min_values,
+        "max_values": live.max_values,
+        "latest": live.latest(),
+        "current": [live.is_current(sequence) for sequence in range(1, live.sequence + 1)],
+    }))
+"""
+
+def read_live(block_name):
+    output = subprocess.run(
+        [sys.executable, "-c", READER_SCRIPT, block_name],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+def test_ring_round_trip():
+    block_name = f"bone_motion_test_{os.getpid()}"
+    ranges = (np.full((2, 6), -1.5, dtype=np.float32), np.full((2, 6), 2.5, dtype=np.float32))
+    writer = MotionSharedMemoryWriter(block_name, BONE_NAMES, 'NORMALIZED', 4, ranges)
+    try:
+        live = read_live(block_name)
+        assert live["bone_names"] == BONE_NAMES
+        assert live["column_names"] == ["frame"] + column_names_for(BONE_NAMES)
+        assert live["coordinate_system"] == "normalized"
+        assert live["min_values"]["Left Hand"] == [-1.5] * 6
+        assert live["max_values"]["Hips"] == [2.5] * 6
+        assert live["latest"] is None
+
+        # More frames than slots, so the ring wraps around
+        rng = np.random.default_rng(20)
+        for frame in range(11, 17):
+            values = rng.uniform(-1.0, 1.0, (len(BONE_NAMES), 6)).astype(np.float32)
+            writer.write_frame(frame, values)
+
+        live = read_live(block_name)
+        sequence, frame, latest_values = live["latest"]
+        assert (sequence, frame) == (6, 16)
+        np.testing.assert_array_equal(latest_values, values)
+        assert live["current"] == [False, False, True, True, True, True]
+    finally:
+        writer.finish()
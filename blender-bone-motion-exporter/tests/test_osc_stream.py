@@ -0,0 +1,81 @@
+import socket
+import struct
+
+import numpy as np
+import pytest
+
+from bone_motion_exporter import OSC_MAX_DATAGRAM, MotionOSCWriter
+
+def read_string(data, offset):
+    end = data.index(b"\0", offset)
+    return data[offset:end].decode("utf-8"), end + 4 - (end % 4)
+
+def parse_message(data):
+    address, offset = read_string(data, 0)
+    type_tags, offset = read_string(data, offset)
+    arguments = []
+    for tag in type_tags[1:]:
+        arguments.append(struct.unpack_from(">i" if tag == "i" else ">f", data, offset)[0])
+        offset += 4
+    return address, arguments
+
+def parse_datagram(data):
+    """Messages of an OSC datagram, a bundle or a single message"""
+    if not data.startswith(b"#bundle\0"):
+        return [parse_message(data)]
+
+    messages = []
+    offset = 16
+    while offset < len(data):
+        (size,) = struct.unpack_from(">i", data, offset)
+        messages.append(parse_message(data[offset + 4:offset + 4 + size]))
+        offset += 4 + size
+    return messages
+
+@pytest.fixture
+def listener():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    yield receiver
+    receiver.close()
+
+def receive_all(receiver):
+    datagrams = []
+    receiver.settimeout(0.2)
+    try:
+        while True:
+            datagrams.append(receiver.recv(65536))
+    except socket.timeout:
+        return datagrams
+
+def send_frame(listener, bone_names, use_bundles):
+    values = np.arange(len(bone_names) * 6, dtype=np.float32).reshape(len(bone_names), 6) / 8.0
+    writer = MotionOSCWriter("127.0.0.1", listener.getsockname()[1], "/motion/", bone_names, use_bundles)
+    writer.write_frame(-3, values)
+    writer.finish()
+    return values, receive_all(listener)
+
+def test_split_bundles_name_their_frame(listener):
+    # Enough bones for the frame's bundle to need several datagrams
+    bone_names = [f"Bone {bone_idx}" for bone_idx in range(400)]
+    values, datagrams = send_frame(listener, bone_names, True)
+    assert len(datagrams) > 1
+
+    received = {}
+    for datagram in datagrams:
+        assert len(datagram) <= OSC_MAX_DATAGRAM
+        messages = parse_datagram(datagram)
+        assert messages[0] == ("/motion/frame", [-3])
+        received.update(messages[1:])
+
+    assert list(received) == [f"/motion/Bone_{bone_idx}" for bone_idx in range(400)]
+    np.testing.assert_array_equal(list(received.values()), values)
+
+def test_single_messages(listener):
+    bone_names = ["Hips", "Left Hand"]
+    values, datagrams = send_frame(listener, bone_names, False)
+
+    messages = [message for datagram in datagrams for message in parse_datagram(datagram)]
+    assert messages[0] == ("/motion/frame", [-3])
+    assert [address for address, arguments in messages[1:]] == ["/motion/Hips", "/motion/Left_Hand"]
+    np.testing.assert_array_equal([arguments for address, arguments in messages[1:]], values)
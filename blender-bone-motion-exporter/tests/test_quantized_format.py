@@ -0,0 +1,46 @@
+import numpy as np
+
+from bone_motion_exporter import QUANTIZED_SCALE, MotionQuantizedWriter
+from bone_motion_reader import read_quantized
+
+BONE_NAMES = ["Hips", "LeftHand"]
+
+def write_quantized(filepath, frames, values, coordinate_system, ranges):
+    with open(filepath, 'wb') as outfile:
+        writer = MotionQuantizedWriter(outfile, BONE_NAMES, coordinate_system, ranges)
+        for frame, frame_values in zip(frames, values):
+            writer.write_frame(frame, frame_values)
+        writer.finish()
+    return writer.max_error
+
+def test_world_round_trip(tmp_path):
+    # Frames going backwards and skipping exercise negative and large frame deltas
+    frames = [5, 6, 8, 7, 300]
+    rng = np.random.default_rng(10)
+    values = rng.uniform(-3.0, 3.0, (len(frames), len(BONE_NAMES), 6)).astype(np.float32)
+    ranges = (values.min(axis=0), values.max(axis=0))
+    filepath = tmp_path / "take.bmq"
+    max_error = write_quantized(filepath, frames, values, 'WORLD', ranges)
+
+    motion = read_quantized(filepath)
+    assert motion["frames"] == frames
+    assert motion["bone_names"] == BONE_NAMES
+    assert motion["coordinate_system"] == "world"
+    np.testing.assert_allclose(motion["min_values"]["LeftHand"], ranges[0][1])
+    np.testing.assert_allclose(motion["max_values"]["Hips"], ranges[1][0])
+
+    # One quantization step over the widest range, plus float32 rounding of the ranges
+    tolerance = 6.0 / QUANTIZED_SCALE
+    assert max_error <= tolerance
+    np.testing.assert_allclose(motion["values"], values, atol=tolerance)
+
+def test_normalized_round_trip(tmp_path):
+    frames = [1, 2, 3]
+    values = np.linspace(-1.0, 1.0, len(frames) * len(BONE_NAMES) * 6).reshape(len(frames), len(BONE_NAMES), 6)
+    ranges = (np.full((2, 6), -10.0), np.full((2, 6), 10.0))
+    filepath = tmp_path / "take.bmq"
+    write_quantized(filepath, frames, values, 'NORMALIZED', ranges)
+
+    motion = read_quantized(filepath)
+    assert motion["coordinate_system"] == "normalized"
+    np.testing.assert_allclose(motion["values"], values, atol=1.0 / QUANTIZED_SCALE)
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from bone_motion_exporter import BONE_OT_export_motion_data
+
+def make_operator():
+    operator = BONE_OT_export_motion_data.__new__(BONE_OT_export_motion_data)
+    operator.bone_selection = 'BONE'
+    operator.bone_to_export = "ALL"
+    operator.bone_pattern = ""
+    operator.use_regex = False
+    operator.bone_collection = ""
+    operator.show_hidden_bones = False
+    return operator
+
+@pytest.mark.parametrize("frames", [range(0, 40), range(-25, 15, 2)])
+def test_shard_frames_survive_property_limits(frames):
+    # Blender clamps the values of properties with a hard min/max, workers would sample other frames
+    operator = make_operator()
+    annotations = BONE_OT_export_motion_data.__annotations__
+    for shard in np.array_split(np.array(frames), 4):
+        options = operator.get_shard_options("shard", shard, 2)
+        assert (options["start_frame"], options["end_frame"]) == (shard[0], shard[-1])
+        for name in ("start_frame", "end_frame"):
+            limits = annotations[name].keywords
+            assert limits.get("min", options[name]) <= options[name] <= limits.get("max", options[name])